@@ -9,8 +9,9 @@ Mechanics:
 """
 from __future__ import annotations
 
-from collections import deque
-from typing import Deque, Tuple, Optional
+from typing import Tuple, Optional
+
+from MonocularTracker.control.running_window import RunningWindow
 
 
 class DriftCorrector:
@@ -26,7 +27,9 @@ class DriftCorrector:
         self.threshold_ratio = float(threshold_ratio)
         self.learn_rate = float(learn_rate)
 
-        self._errors: Deque[Tuple[float, float]] = deque(maxlen=self.window_size)
+        # Rolling error windows per axis, so the mean is O(1) per update
+        self._err_x = RunningWindow(self.window_size)
+        self._err_y = RunningWindow(self.window_size)
         self._offset_x: float = 0.0
         self._offset_y: float = 0.0
 
@@ -49,8 +52,8 @@ class DriftCorrector:
             return
         ox, oy = observed_xy
         tx, ty = target_xy
-        err = (float(tx - ox), float(ty - oy))
-        self._errors.append(err)
+        self._err_x.push(tx - ox)
+        self._err_y.push(ty - oy)
 
         mean_err = self._mean_error()
         if mean_err is None:
@@ -64,7 +67,8 @@ class DriftCorrector:
             self._offset_y += my * self.learn_rate
 
     def reset(self) -> None:
-        self._errors.clear()
+        self._err_x.reset()
+        self._err_y.reset()
         self._offset_x = 0.0
         self._offset_y = 0.0
 
@@ -77,9 +81,6 @@ class DriftCorrector:
 
     # Internals ----------------------------------------------------------
     def _mean_error(self) -> Optional[Tuple[float, float]]:
-        if not self._errors:
+        if not len(self._err_x):
             return None
-        sx = sum(e[0] for e in self._errors)
-        sy = sum(e[1] for e in self._errors)
-        n = float(len(self._errors))
-        return sx / n, sy / n
+        return self._err_x.mean(), self._err_y.mean()
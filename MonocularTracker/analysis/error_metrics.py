@@ -16,13 +16,16 @@ class PointError:
 
 def compute_point_errors(true_points: Sequence[Tuple[int, int]], predicted_points: Sequence[Tuple[int, int]]) -> List[PointError]:
     assert len(true_points) == len(predicted_points), "true and predicted lists must have same length"
-    out: List[PointError] = []
-    for t, p in zip(true_points, predicted_points):
-        dx = float(p[0] - t[0])
-        dy = float(p[1] - t[1])
-        dist = math.hypot(dx, dy)
-        out.append(PointError(true_xy=t, pred_xy=p, dist_px=dist))
-    return out
+    if len(true_points) == 0:
+        return []
+    # Distances in one vectorized pass; accepts lists of tuples or (N, 2) arrays
+    tp = np.asarray(true_points)
+    pp = np.asarray(predicted_points)
+    dists = np.hypot(pp[:, 0] - tp[:, 0], pp[:, 1] - tp[:, 1]).tolist()
+    return [
+        PointError(true_xy=(int(t[0]), int(t[1])), pred_xy=(int(p[0]), int(p[1])), dist_px=d)
+        for t, p, d in zip(tp.tolist(), pp.tolist(), dists)
+    ]
 
 
 def compute_mean_error(errors: Sequence[PointError]) -> float:
@@ -13,8 +13,8 @@ from .error_metrics import PointError
 def fig_scatter(true_pts: List[Tuple[int, int]], pred_pts: List[Tuple[int, int]], errors: List[PointError]):
     fig, ax = plt.subplots(figsize=(6, 4))
     ax.set_title("Calibration Error Scatter Plot")
-    tp = np.array(true_pts)
-    pp = np.array(pred_pts)
+    tp = np.asarray(true_pts)
+    pp = np.asarray(pred_pts)
     if len(tp) > 0:
         ax.scatter(tp[:, 0], tp[:, 1], c="green", label="True")
     if len(pp) > 0:
@@ -34,11 +34,11 @@ def fig_scatter(true_pts: List[Tuple[int, int]], pred_pts: List[Tuple[int, int]]
 def fig_vectors(true_pts: List[Tuple[int, int]], pred_pts: List[Tuple[int, int]]):
     fig, ax = plt.subplots(figsize=(6, 4))
     ax.set_title("Gaze Error Vectors")
-    if not true_pts:
+    if len(true_pts) == 0:
         fig.tight_layout()
         return fig
-    tp = np.array(true_pts)
-    pp = np.array(pred_pts) if pred_pts else np.zeros_like(tp)
+    tp = np.asarray(true_pts)
+    pp = np.asarray(pred_pts) if len(pred_pts) else np.zeros_like(tp)
     dx = pp[:, 0] - tp[:, 0]
     dy = pp[:, 1] - tp[:, 1]
     # Normalize vectors visually to avoid very long arrows dominating
@@ -7,11 +7,14 @@ Requirements covered:
 - read() returns BGR frames (OpenCV default)
 - Graceful shutdown and error handling
 - Consistent FPS via software pacing (target_fps)
+- Optional background capture thread that keeps only the newest frame
+- Low-latency hints: 1-frame driver buffer, hardware decode where offered
 """
 from __future__ import annotations
 
+import threading
 import time
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import os
 
 try:
@@ -20,6 +23,67 @@ except Exception:  # pragma: no cover
     cv2 = None
 
 
+def _open_capture(idx: int, be: int):
+    """Open a VideoCapture, passing hardware-acceleration hints to MSMF.
+
+    Like the MSMF async reader, this asks the driver not to decode into a deep
+    queue of stale frames. Only MSMF gets the params-array form; other
+    backends may refuse an open that carries properties they do not know.
+    """
+    hw = getattr(cv2, "CAP_PROP_HW_ACCELERATION", None)
+    hw_any = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+    if be == getattr(cv2, "CAP_MSMF", None) and hw is not None and hw_any is not None:
+        try:
+            return cv2.VideoCapture(idx, be, [hw, hw_any])
+        except TypeError:
+            # OpenCV < 4.5.2 has no params overload
+            pass
+    return cv2.VideoCapture(idx, be)
+
+
+def _capture_worker(
+    cap,
+    stop_event: threading.Event,
+    slot: list,
+    cond: threading.Condition,
+    dev_lock: threading.Lock,
+    dev_wanted: threading.Event,
+) -> None:
+    """Producer loop for the capture thread: overwrite slot[0] with (seq, frame).
+
+    Kept deliberately tight. ``grab``/``retrieve`` release the GIL inside OpenCV,
+    so the only Python work per frame is a counter bump and one locked store
+    plus a wake-up for a waiting consumer; no logging, timing calls or
+    attribute chains run inside the loop. ``dev_lock`` is held around the
+    device calls so Camera.with_device() callers never overlap them; while
+    ``dev_wanted`` is set the loop steps aside so such a caller gets the lock
+    after the current frame instead of racing this thread for it.
+    """
+    grab = cap.grab
+    retrieve = cap.retrieve
+    stopped = stop_event.is_set
+    backoff = stop_event.wait
+    wanted = dev_wanted.is_set
+    seq = 0
+    while not stopped():
+        if wanted():
+            backoff(0.001)
+            continue
+        with dev_lock:
+            grabbed = grab()
+            ok, frame = retrieve() if grabbed else (False, None)
+        if not grabbed:
+            # Device hiccup: back off briefly instead of spinning
+            backoff(0.01)
+            continue
+        if not ok:
+            continue
+        seq += 1
+        with cond:
+            slot[0] = (seq, frame)
+            cond.notify_all()
+
+
 class Camera:
     def __init__(
         self,
@@ -35,6 +99,17 @@ class Camera:
         self._frame_interval = 1.0 / float(self.target_fps)
         self._last_time = 0.0
         self.cap = None
+        # Background capture state (see start_capture)
+        self._cap_thread: Optional[threading.Thread] = None
+        self._cap_stop = threading.Event()
+        self._cap_lock = threading.Lock()
+        # Signalled by the capture thread on every new frame (see wait_latest)
+        self._cap_cond = threading.Condition(self._cap_lock)
+        self._cap_slot: list = [None]
+        # VideoCapture is not thread-safe: every call on self.cap made while
+        # the capture thread runs must hold this (see with_device)
+        self._dev_lock = threading.Lock()
+        self._dev_wanted = threading.Event()
 
     def open(self) -> None:
         if cv2 is None:
@@ -76,7 +151,7 @@ class Camera:
         for idx in candidate_indices:
             for be in be_list:
                 try:
-                    cap = cv2.VideoCapture(idx, be)
+                    cap = _open_capture(idx, be)
                     tried.append((idx, be))
                     if cap is None or not cap.isOpened():
                         if cap is not None:
@@ -115,6 +190,12 @@ class Camera:
             self.cap.set(cv2.CAP_PROP_FPS, float(self.target_fps))
         except Exception:
             pass
+        # Keep at most one frame queued in the driver (MSMF defaults to several),
+        # so each grab returns a fresh frame rather than one 60-120 ms old
+        try:
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        except Exception:
+            pass
         # Verify and store actual resolution
         try:
             actual_w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -123,11 +204,89 @@ class Camera:
                 self.width, self.height = actual_w, actual_h
         except Exception:
             pass
+        # Warm up once here so read() never has to retry: discard frames until
+        # the device delivers one, within a bounded wait
+        deadline = time.perf_counter() + 1.0
+        while True:
+            ok, _ = self.cap.read()
+            if ok:
+                break
+            if time.perf_counter() > deadline:
+                self.close()
+                raise RuntimeError("Camera failed to deliver a first frame.")
         self._last_time = time.perf_counter()
 
+    def start_capture(self) -> None:
+        """Grab frames on a daemon thread; read() then returns the newest one without blocking."""
+        if self.cap is None or self._cap_thread is not None:
+            return
+        self._cap_stop.clear()
+        self._cap_slot[0] = None
+        t = threading.Thread(
+            target=_capture_worker,
+            args=(self.cap, self._cap_stop, self._cap_slot, self._cap_cond, self._dev_lock, self._dev_wanted),
+            name="camera-capture",
+            daemon=True,
+        )
+        t.start()
+        self._cap_thread = t
+
+    def stop_capture(self) -> None:
+        t = self._cap_thread
+        if t is None:
+            return
+        self._cap_stop.set()
+        # grab() normally blocks for about one frame period, but a stalled or
+        # unplugged device can hold it far longer
+        t.join(timeout=1.0)
+        if t.is_alive():
+            # Keep the handle: close() must not free the device under it
+            return
+        self._cap_thread = None
+
+    @property
+    def capturing(self) -> bool:
+        return self._cap_thread is not None
+
+    def read_latest(self) -> Optional[Tuple[int, object]]:
+        """Return (seq, frame) for the newest captured frame, or None if none yet."""
+        with self._cap_lock:
+            return self._cap_slot[0]
+
+    def wait_latest(self, after_seq: int, timeout: float) -> Optional[Tuple[int, object]]:
+        """Like read_latest, but block up to ``timeout`` s for a frame newer than ``after_seq``.
+
+        Returns whatever is newest when the wait ends, which may still be
+        ``after_seq`` on timeout (or None if nothing was captured yet).
+        """
+        slot = self._cap_slot
+        with self._cap_cond:
+            self._cap_cond.wait_for(lambda: slot[0] is not None and slot[0][0] != after_seq, timeout)
+            return slot[0]
+
+    def with_device(self, fn: Callable[[object], object]) -> object:
+        """Run ``fn(cap)`` with exclusive access to the open VideoCapture.
+
+        Property reads/writes from other threads (settings sliders, probes)
+        must go through here so they never race the capture thread's grab.
+        Returns None when the camera is closed.
+        """
+        self._dev_wanted.set()
+        try:
+            with self._dev_lock:
+                cap = self.cap
+                if cap is None:
+                    return None
+                return fn(cap)
+        finally:
+            self._dev_wanted.clear()
+
     def read(self) -> Optional[object]:  # Returns a BGR numpy array or None on failure
         if self.cap is None:
             return None
+        if self._cap_thread is not None:
+            latest = self.read_latest()
+            return latest[1] if latest is not None else None
         # Software pacing to achieve consistent FPS
         now = time.perf_counter()
         elapsed = now - self._last_time
@@ -137,16 +296,8 @@ class Camera:
             time.sleep(remaining)
         self._last_time = time.perf_counter()
 
-        # Some cameras need a couple of reads to warm up; retry briefly
-        tries = 0
-        frame = None
-        ok = False
-        while tries < 3:
-            ok, frame = self.cap.read()
-            if ok and frame is not None:
-                break
-            tries += 1
-            time.sleep(0.01)
+        # Warm-up happened in open(); a failed read is simply retried next tick
+        ok, frame = self.cap.read()
         if not ok or frame is None:
             return None
         # OpenCV returns BGR by default; ensure it's contiguous
@@ -156,11 +307,26 @@ class Camera:
             return None
 
     def close(self) -> None:
+        # Stop the producer before releasing the device it reads from
+        self.stop_capture()
         if self.cap is not None:
+            # A producer still inside grab() holds _dev_lock; releasing under
+            # it means the device is never freed while a grab is running
+            self._dev_wanted.set()
             try:
-                self.cap.release()
+                with self._dev_lock:
+                    try:
+                        self.cap.release()
+                    finally:
+                        self.cap = None
             finally:
-                self.cap = None
+                self._dev_wanted.clear()
+        t = self._cap_thread
+        if t is not None:
+            # Past its last grab now; it exits at the next stop check
+            t.join(timeout=1.0)
+            if not t.is_alive():
+                self._cap_thread = None
 
     @property
     def is_open(self) -> bool:
@@ -170,9 +336,8 @@ class Camera:
         """Update pacing FPS (software interval); attempts to set camera hint too."""
         self.target_fps = max(1, int(fps))
         self._frame_interval = 1.0 / float(self.target_fps)
-        if self.cap is not None:
-            try:
-                self.cap.set(cv2.CAP_PROP_FPS, float(self.target_fps))
-            except Exception:
-                pass
+        try:
+            self.with_device(lambda cap: cap.set(cv2.CAP_PROP_FPS, float(self.target_fps)))
+        except Exception:
+            pass
 
@@ -6,6 +6,7 @@ API:
 
 Notes:
 - Built-in pyautogui pauses are disabled (PAUSE=0) and FAILSAFE is off.
+- Backend errors are swallowed here, so per-frame callers need no guard.
 """
 from __future__ import annotations
 
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections import deque
+
+
+class MonoWindow:
+    """Sliding-window min/max/range in O(1) amortized per sample.
+
+    Keeps an ascending deque for the minimum and a descending one for the
+    maximum; each sample enters and leaves each deque at most once. Indices
+    and values live in parallel deques so a push allocates no tuples.
+    """
+
+    __slots__ = ("size", "_vals", "_min_i", "_min_v", "_max_i", "_max_v", "_i")
+
+    def __init__(self, size: int = 90) -> None:
+        self.size = max(1, int(size))
+        self._vals: deque[float] = deque(maxlen=self.size)
+        self._min_i: deque[int] = deque()
+        self._min_v: deque[float] = deque()
+        self._max_i: deque[int] = deque()
+        self._max_v: deque[float] = deque()
+        self._i = 0
+
+    def __len__(self) -> int:
+        return len(self._vals)
+
+    def push(self, val: float) -> None:
+        v = float(val)
+        i = self._i
+        self._i = i + 1
+        self._vals.append(v)
+        mi, mv = self._min_i, self._min_v
+        while mv and mv[-1] >= v:
+            mv.pop()
+            mi.pop()
+        mi.append(i)
+        mv.append(v)
+        xi, xv = self._max_i, self._max_v
+        while xv and xv[-1] <= v:
+            xv.pop()
+            xi.pop()
+        xi.append(i)
+        xv.append(v)
+        # Only sample i - size can have just left the window
+        lo = i - self.size
+        if mi[0] <= lo:
+            mi.popleft()
+            mv.popleft()
+        if xi[0] <= lo:
+            xi.popleft()
+            xv.popleft()
+
+    def min(self) -> float:
+        return self._min_v[0] if self._min_v else 0.0
+
+    def max(self) -> float:
+        return self._max_v[0] if self._max_v else 0.0
+
+    def range(self) -> float:
+        if not self._vals:
+            return 0.0
+        return self._max_v[0] - self._min_v[0]
+
+    def resize(self, size: int) -> None:
+        """Change the window length, rebuilding from the retained samples."""
+        old = list(self._vals)
+        self.size = max(1, int(size))
+        self._vals = deque(maxlen=self.size)
+        for d in (self._min_i, self._min_v, self._max_i, self._max_v):
+            d.clear()
+        self._i = 0
+        for v in old[-self.size:]:
+            self.push(v)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import math
+from array import array
+
+
+class RunningWindow:
+    """Sliding-window sum/mean over the last ``size`` samples in O(1) per push.
+
+    Samples live in a preallocated array ring (no boxed floats); the running
+    sum subtracts the slot being overwritten and is re-summed with fsum once
+    per lap, so rounding error cannot accumulate.
+    """
+
+    __slots__ = ("size", "_arr", "_idx", "_n", "_sum")
+
+    def __init__(self, size: int = 60) -> None:
+        self.size = max(1, int(size))
+        self._arr = array("d", [0.0]) * self.size
+        self._idx = 0
+        self._n = 0
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def push(self, val: float) -> None:
+        v = float(val)
+        arr = self._arr
+        i = self._idx
+        # Slots beyond _n are still zero, so subtracting them is harmless
+        self._sum += v - arr[i]
+        arr[i] = v
+        i += 1
+        if i == self.size:
+            i = 0
+            self._sum = math.fsum(arr)
+        self._idx = i
+        if self._n < self.size:
+            self._n += 1
+
+    def sum(self) -> float:
+        return self._sum
+
+    def mean(self) -> float:
+        return self._sum / self._n if self._n else 0.0
+
+    def reset(self) -> None:
+        arr = self._arr
+        for i in range(self.size):
+            arr[i] = 0.0
+        self._idx = 0
+        self._n = 0
+        self._sum = 0.0
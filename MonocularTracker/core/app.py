@@ -2,16 +2,22 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 try:
-    from PyQt6.QtCore import QTimer
+    from PyQt6.QtCore import QMetaObject, QThread, QTimer, Qt
     from PyQt6.QtWidgets import QApplication, QMessageBox
 except Exception:  # pragma: no cover
     QApplication = None  # type: ignore
     QTimer = None  # type: ignore
+    QThread = None  # type: ignore
+    QMetaObject = None  # type: ignore
+    Qt = None  # type: ignore
 
+import math
 import os
 import sys
+import time
 import weakref
 
 # Reduce noisy logs from TF/MediaPipe/OpenCV before heavy imports initialize logging
@@ -48,6 +54,11 @@ try:
 except Exception:
     cv2 = None
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 # Further reduce absl logs from Python side (after imports initialize handlers)
 try:
     import absl.logging as absl_logging  # type: ignore
@@ -60,6 +71,7 @@ from MonocularTracker.ui.main_window import MainWindow
 from MonocularTracker.ui.panic_overlay import PanicOverlay
 from MonocularTracker.ui.calibration_ui import CalibrationUI
 from MonocularTracker.ui.calibration_plots import CalibrationPlotsWindow
+from MonocularTracker.ui.screen_geometry import on_screen_change
 try:
     # Prefer the enhanced camera settings dialog
     from MonocularTracker.ui.camera_settings import CameraSettingsWindow  # type: ignore
@@ -69,9 +81,77 @@ except Exception:  # pragma: no cover
     except Exception:
         CameraSettingsWindow = None  # type: ignore
 from MonocularTracker.tracking.camera_controller import CameraController
-from MonocularTracker.tracking.pipeline import Pipeline
+from MonocularTracker.tracking.pipeline import FrameResult, Pipeline
+from MonocularTracker.core.processing_worker import ProcessingWorker
 from MonocularTracker.control.cursor import CursorController
 from MonocularTracker.control.fps_monitor import FPSMonitor
+from MonocularTracker.control.mono_window import MonoWindow
+
+
+# Saved calibration model, next to settings.json
+_CALIB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "calibration_state.json")
+
+
+def _camera_backends() -> tuple:
+    """(label, CAP_*) for the specific backends this OpenCV build provides."""
+    if cv2 is None:
+        return ()
+    out = tuple(
+        (label, getattr(cv2, f"CAP_{name}", None)) for (label, name) in (("MSMF", "MSMF"), ("DShow", "DSHOW"))
+    )
+    out = tuple((n, b) for (n, b) in out if b is not None)
+    # Skip backends this OpenCV build was not compiled with
+    try:
+        available = set(cv2.videoio_registry.getCameraBackends())
+        out = tuple((n, b) for (n, b) in out if b in available)
+    except Exception:
+        pass
+    return out
+
+
+# Resolved once at import; scans only iterate these
+_CAM_BACKENDS = _camera_backends()
+_CAP_ANY = getattr(cv2, "CAP_ANY", None) if cv2 is not None else None
+
+
+def _probe_cameras(max_index: int = 10) -> list[tuple[int, str]]:
+    """Return (index, label) for each camera that opens; runs off the GUI thread."""
+    found: list[tuple[int, str]] = []
+    if cv2 is None:
+        return found
+    backends = _CAM_BACKENDS
+    any_be = _CAP_ANY
+    specific_found = False
+    for i in range(0, max_index + 1):
+        # CAP_ANY only as a fallback when no specific backend found anything
+        tries = backends
+        if any_be is not None and not specific_found:
+            tries = backends + (("Any", any_be),)
+        for (be_name, be) in tries:
+            cap = None
+            try:
+                cap = cv2.VideoCapture(i, be)
+                if cap is not None and cap.isOpened():
+                    try:
+                        aw = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                        ah = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                        fps = cap.get(cv2.CAP_PROP_FPS)
+                        fps_txt = f"{fps:.0f}" if isinstance(fps, (int, float)) and fps > 0 else "?"
+                        label = f"Camera {i} — {aw}x{ah} @ {fps_txt} [{be_name}]"
+                    except Exception:
+                        label = f"Camera {i} [{be_name}]"
+                    found.append((i, label))
+                    specific_found = specific_found or be != any_be
+                    break
+            except Exception:
+                pass
+            finally:
+                try:
+                    if cap is not None:
+                        cap.release()
+                except Exception:
+                    pass
+    return found
 
 
 class AppCore:
@@ -85,67 +165,83 @@ class AppCore:
                 pass
         self.cursor = CursorController()
         self.timer = QTimer()
-        self.timer.setInterval(33)
-        self.timer.timeout.connect(self._on_tick)  # type: ignore[attr-defined]
+        # Tick faster than the camera so a new frame is picked up within ~16 ms
+        # of landing; ticks without a new frame return immediately
+        self.timer.setInterval(16)
+        # Precise timer keeps tick intervals stable (coarse timers jitter ~5%)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._schedule_work)  # type: ignore[attr-defined]
         self.fps = FPSMonitor(window=60)
+        # Status/signal/FPS labels are refreshed at ~5 Hz rather than every frame
+        self._status_next_t = 0.0
+        # Cursor writes stay at ~30 Hz regardless of the tick rate
+        self._cursor_next_t = 0.0
         # Signal thresholds/window from settings
         x_ok, x_strong, y_ok, y_strong = self.settings.signal_thresholds()
         self._sig_thr_x_ok = float(x_ok)
         self._sig_thr_x_strong = float(x_strong)
         self._sig_thr_y_ok = float(y_ok)
         self._sig_thr_y_strong = float(y_strong)
-        # Recent feature history for live signal indicator
-        self._sig_hist = deque(maxlen=max(30, int(self.settings.signal_window())))
+        # Recent (nx, ny) ranges for live signal indicator; monotonic windows
+        # keep min/max current in O(1) per sample for any window length
+        self._sig_win = max(30, int(self.settings.signal_window()))
+        self._sig_x = MonoWindow(self._sig_win)
+        self._sig_y = MonoWindow(self._sig_win)
 
         self.win = MainWindow()
-        self.win.startRequested.connect(self.start_tracking)  # type: ignore[attr-defined]
-        self.win.stopRequested.connect(self.stop_tracking)  # type: ignore[attr-defined]
-        self.win.calibrate5Requested.connect(lambda: self.start_calibration(points=5))  # type: ignore[attr-defined]
-        self.win.calibrate9Requested.connect(lambda: self.start_calibration(points=9))  # type: ignore[attr-defined]
-        # Camera selection from main UI
-        try:
-            self.win.scanCamerasRequested.connect(self._scan_cameras_main)  # type: ignore[attr-defined]
-            self.win.useSelectedCameraRequested.connect(self._use_selected_camera_main)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            self.win.cameraSettingsRequested.connect(self.open_camera_settings)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # Wire Fail-Safe button if present
-        try:
-            if hasattr(self.win, "btn_panic"):
-                self.win.btn_panic.clicked.connect(self.trigger_panic)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # Wire basic camera settings tab controls if present
-        try:
-            if hasattr(self.win, "btn_apply_cam"):
-                self.win.btn_apply_cam.clicked.connect(self._apply_basic_camera_tab)  # type: ignore[attr-defined]
-            if hasattr(self.win, "sld_brightness"):
-                self.win.sld_brightness.valueChanged.connect(lambda _: self._cam_controller.set_brightness(float(self.win.sld_brightness.value())))  # type: ignore[attr-defined]
-            if hasattr(self.win, "sld_contrast"):
-                self.win.sld_contrast.valueChanged.connect(lambda _: self._cam_controller.set_contrast(float(self.win.sld_contrast.value())))  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # Eye mode change signal
-        try:
-            if hasattr(self.win, "eyeModeChanged"):
-                self.win.eyeModeChanged.connect(self._on_eye_mode_changed)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # Signal config live-tuning
-        try:
-            if hasattr(self.win, "signalConfigChanged"):
-                self.win.signalConfigChanged.connect(self._on_signal_config_changed)  # type: ignore[attr-defined]
-        except Exception:
-            pass
+        # Coalesce settings writes: handlers restart a 500 ms single-shot
+        # timer instead of writing JSON on every spinbox step
+        self._save_timer = QTimer(self.win)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings)  # type: ignore[attr-defined]
+        # MainWindow signals -> slots; optional ones are simply absent
+        win_signals = (
+            ("startRequested", self.start_tracking),
+            ("stopRequested", self.stop_tracking),
+            ("calibrate5Requested", lambda: self.start_calibration(points=5)),
+            ("calibrate9Requested", lambda: self.start_calibration(points=9)),
+            ("scanCamerasRequested", self._scan_cameras_main),
+            ("useSelectedCameraRequested", self._use_selected_camera_main),
+            ("cameraSettingsRequested", self.open_camera_settings),
+            ("eyeModeChanged", self._on_eye_mode_changed),
+            ("signalConfigChanged", self._on_signal_config_changed),
+            ("visibilityChanged", self._on_visibility_changed),
+        )
+        for name, slot in win_signals:
+            sig = getattr(self.win, name, None)
+            if sig is not None:
+                sig.connect(slot)
+        # Optional widgets: (widget attribute, signal, slot)
+        widget_signals = (
+            ("btn_panic", "clicked", self.trigger_panic),
+            ("btn_apply_cam", "clicked", self._apply_basic_camera_tab),
+            ("sld_brightness", "valueChanged", lambda v: self._cam_controller.set_brightness(float(v))),
+            ("sld_contrast", "valueChanged", lambda v: self._cam_controller.set_contrast(float(v))),
+        )
+        for name, sig_name, slot in widget_signals:
+            sig = getattr(getattr(self.win, name, None), sig_name, None)
+            if sig is not None:
+                sig.connect(slot)
         self._panic_overlay: Optional[PanicOverlay] = None
         self._install_panic_shortcuts(self.win)
         self._win_ref = weakref.ref(self.win)
+        # Bound methods used every tick, resolved once
+        self._update_video = self.win.update_video
+        self._update_status = self.win.update_status
+        self._update_signal = self.win.update_signal
+        self._signal_bars = getattr(self.win, "signal_bars", None)
+        self._cursor_move = self.cursor.move_cursor
+        self._fps_tick = self.fps.tick
 
         # Setup pipeline
-        screen_w, screen_h = self._screen_size()
+        # Screen geometry and the accuracy threshold are resolved once and
+        # refreshed only when screens change (see _on_screens_changed); the
+        # threshold is also refreshed when calibration starts
+        self._screen_w, self._screen_h = self._screen_size()
+        self._screen_diag = math.hypot(self._screen_w, self._screen_h)
+        self._calib_threshold_px = min(float(self.settings.calib_threshold_px()), self._screen_diag)
+        screen_w, screen_h = self._screen_w, self._screen_h
         self.pipeline = Pipeline(
             camera_index=self.settings.camera_index(),
             screen_size=(screen_w, screen_h),
@@ -154,26 +250,55 @@ class AppCore:
             drift_lr=self.settings.drift_learn_rate(),
             eye_mode=self.settings.eye_mode(),
             gaze_engine=self.settings.gaze_engine(),
-            model_dir=os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
+            model_dir=os.path.join(os.path.dirname(os.path.dirname(__file__)), "models"),
+            calib_method=self.settings.calib_method(),
         )
-        self.tracking = False
+        # Refresh on the same triggers that invalidate CalibrationUI's screen
+        # size, so targets and the accuracy check agree on the geometry
+        try:
+            on_screen_change(self._on_screens_changed)
+        except Exception:
+            pass
+        # Frame processing runs on its own thread; results come back queued
+        # to _on_result on the GUI thread. One request is in flight at a time.
+        self._proc_thread = QThread()
+        self._proc_worker = ProcessingWorker(self.pipeline)
+        self._proc_worker.moveToThread(self._proc_thread)
+        self._proc_worker.resultReady.connect(self._on_result)  # type: ignore[attr-defined]
+        self._proc_thread.start()
+        self._proc_busy = False
+        self._last_res: Optional[FrameResult] = None
+        self._res_seq = 0
+        self._last_uploaded_frame_id = -1
+        # Preview is paused while the window is hidden/minimized and idle
+        self._win_visible = True
+        self._paused_hidden = False
+        self._calib_res_seq = 0
+        # Cursor may move only while tracking with no settings dialog open;
+        # both setters keep the combined _can_move flag current
+        self._tracking = False
+        self._dialog_open = False
+        self._can_move = False
         self._calibration_ui: Optional[CalibrationUI] = None
         self._calibration_samples_true: list[tuple[int, int]] = []
         self._calibration_samples_pred: list[tuple[int, int]] = []
         self._calibration_features: list[tuple[float, float]] = []
         self._calib_recent_feats = deque(maxlen=12)
-        self._settings_dialog_open = False
         self._cam_settings_wnd = None
+        self._cam_fps_label = None
+        self._scan_pool: Optional[ThreadPoolExecutor] = None
+        self._scan_future: Optional[Future] = None
         self._cam_controller = CameraController(
             get_cap=lambda: getattr(self.pipeline.cam, "cap", None),
             restart_callback=self._restart_camera,
             settings=self.settings,
             change_index_callback=self._on_camera_index_changed,
+            with_cap=lambda fn: self.pipeline.cam.with_device(fn),
         )
         # Apply thresholds to signal bars if present
         try:
-            if getattr(self.win, "signal_bars", None) is not None:
-                self.win.signal_bars.set_thresholds(
+            if self._signal_bars is not None:
+                self._signal_bars.set_thresholds(
                     self._sig_thr_x_ok, self._sig_thr_x_strong, self._sig_thr_y_ok, self._sig_thr_y_strong
                 )
             # Initialize UI spinboxes if present
@@ -183,7 +308,7 @@ class AppCore:
                     self._sig_thr_x_strong,
                     self._sig_thr_y_ok,
                     self._sig_thr_y_strong,
-                    int(self._sig_hist.maxlen or 90),
+                    int(self._sig_win),
                 )
         except Exception:
             pass
@@ -204,17 +329,6 @@ class AppCore:
         except Exception:
             pass
 
-        # Attempt to load an existing calibration model
-        try:
-            calib_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "calibration_state.json")
-            if os.path.exists(calib_path):
-                from MonocularTracker.tracking.calibration import Calibrator
-                loaded = Calibrator.load(calib_path)
-                # Replace mapping calibrator with the loaded one
-                self.pipeline.map.calib = loaded
-        except Exception:
-            pass
-
         # Start a safe, cursor-disabled camera preview immediately
         # so the left panel isn’t blank before tracking begins.
         try:
@@ -224,6 +338,42 @@ class AppCore:
             # If preview cannot start (e.g., no camera), keep UI responsive.
             # The user can still select a camera and retry later.
             pass
+        # Load an existing calibration model once the event loop runs so the
+        # window paints first
+        self._calib_loaded = False
+        QTimer.singleShot(0, self._load_calibration)
+
+    def _load_calibration(self) -> None:
+        if self._calib_loaded:
+            return
+        self._calib_loaded = True
+        # Attempt to load an existing calibration model
+        try:
+            from MonocularTracker.tracking.calibration import Calibrator
+            loaded = Calibrator.load(_CALIB_PATH)
+            # Replace mapping calibrator with the loaded one
+            self.pipeline.map.calib = loaded
+        except Exception:
+            # Includes FileNotFoundError: no saved model yet
+            pass
+
+    @property
+    def tracking(self) -> bool:
+        return self._tracking
+
+    @tracking.setter
+    def tracking(self, on: bool) -> None:
+        self._tracking = bool(on)
+        self._can_move = self._tracking and not self._dialog_open
+
+    @property
+    def _settings_dialog_open(self) -> bool:
+        return self._dialog_open
+
+    @_settings_dialog_open.setter
+    def _settings_dialog_open(self, on: bool) -> None:
+        self._dialog_open = bool(on)
+        self._can_move = self._tracking and not self._dialog_open
 
     def _screen_size(self) -> Tuple[int, int]:
         try:
@@ -234,11 +384,27 @@ class AppCore:
             pass
         return (1920, 1080)
 
+    def _on_screens_changed(self) -> None:
+        self._screen_w, self._screen_h = self._screen_size()
+        self._screen_diag = math.hypot(self._screen_w, self._screen_h)
+        self._calib_threshold_px = min(float(self.settings.calib_threshold_px()), self._screen_diag)
+        self.pipeline.screen_size = (self._screen_w, self._screen_h)
+
+    def _save_settings_later(self) -> None:
+        self._save_timer.start()
+
+    def _flush_settings(self) -> None:
+        self._save_timer.stop()
+        try:
+            self.settings.save()
+        except Exception:
+            pass
+
     def _on_eye_mode_changed(self, mode: str) -> None:
         # Persist selection and update live parser
         try:
             self.settings.set_eye_mode(mode)
-            self.settings.save()
+            self._save_settings_later()
         except Exception:
             pass
         try:
@@ -253,11 +419,11 @@ class AppCore:
         self._sig_thr_x_strong = float(x_strong)
         self._sig_thr_y_ok = float(y_ok)
         self._sig_thr_y_strong = float(y_strong)
-        # Update deque window size (preserve recent values)
+        # Resize signal windows (preserve the most recent values)
         try:
-            win = max(30, int(window))
-            old = list(self._sig_hist)
-            self._sig_hist = deque(old[-win:], maxlen=win)
+            self._sig_win = max(30, int(window))
+            self._sig_x.resize(self._sig_win)
+            self._sig_y.resize(self._sig_win)
         except Exception:
             pass
         # Persist to settings
@@ -268,13 +434,13 @@ class AppCore:
             s.setdefault("strong", {})["rx"] = float(x_strong)
             s.setdefault("strong", {})["ry"] = float(y_strong)
             s["window"] = int(window)
-            self.settings.save()
+            self._save_settings_later()
         except Exception:
             pass
         # Update bars
         try:
-            if getattr(self.win, "signal_bars", None) is not None:
-                self.win.signal_bars.set_thresholds(
+            if self._signal_bars is not None:
+                self._signal_bars.set_thresholds(
                     self._sig_thr_x_ok, self._sig_thr_x_strong, self._sig_thr_y_ok, self._sig_thr_y_strong
                 )
         except Exception:
@@ -312,10 +478,9 @@ class AppCore:
             pass
         if self._panic_overlay is not None:
             try:
-                self._panic_overlay.close()
+                self._panic_overlay.hide()
             except Exception:
                 pass
-            self._panic_overlay = None
         try:
             QMessageBox.information(self.win, "Safety", "Tracking stopped for safety. Cursor control disabled.")
         except Exception:
@@ -323,10 +488,35 @@ class AppCore:
         # Re-enable start button
         self.win.toggle_controls(tracking=False)
 
+    def _on_visibility_changed(self, visible: bool) -> None:
+        self._win_visible = bool(visible)
+        if not visible:
+            # Cursor control and calibration need frames even when hidden;
+            # a bare preview nobody can see does not
+            calibrating = self._calibration_ui is not None and self._calibration_ui.isVisible()
+            if self.tracking or calibrating or not self.timer.isActive():
+                return
+            self.timer.stop()
+            try:
+                self.pipeline.stop()
+            except Exception:
+                pass
+            self._paused_hidden = True
+        elif self._paused_hidden:
+            self._paused_hidden = False
+            try:
+                self.pipeline.start()
+            except Exception:
+                pass
+            self.timer.start()
+
     # Tracking ----------------------------------------------------------
     def start_tracking(self) -> None:
         if self.tracking:
             return
+        # Make sure the saved model is in place before the cursor moves
+        if not self._calib_loaded:
+            self._load_calibration()
         # Safety confirmation
         try:
             if QMessageBox.question(self.win, "Safety", "Start cursor control now?", QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel) != QMessageBox.StandardButton.Ok:
@@ -348,9 +538,10 @@ class AppCore:
             return
         self.tracking = True
         self.win.toggle_controls(tracking=True)
-        # Show panic overlay
+        # Show panic overlay (built once, then only shown/hidden)
         try:
-            self._panic_overlay = PanicOverlay(panic_callback=self.trigger_panic)
+            if self._panic_overlay is None:
+                self._panic_overlay = PanicOverlay(panic_callback=self.trigger_panic)
             self._panic_overlay.show()
         except Exception:
             self._panic_overlay = None
@@ -360,12 +551,6 @@ class AppCore:
                 self.timer.start()
         except Exception:
             pass
-            # Eye mode change
-            try:
-                if hasattr(self.win, "eyeModeChanged"):
-                    self.win.eyeModeChanged.connect(self._on_eye_mode_changed)  # type: ignore[attr-defined]
-            except Exception:
-                pass
 
     def stop_tracking(self) -> None:
         self.trigger_panic()
@@ -403,73 +588,66 @@ class AppCore:
 
     # Camera scanning support for main UI -----------------------------
     def _scan_cameras_main(self) -> None:
-        try:
-            import cv2  # type: ignore
-        except Exception:
+        if cv2 is None:
             try:
                 QMessageBox.information(self.win, "Camera", "OpenCV is not available.")
             except Exception:
                 pass
             return
-        # Update UI state
+        if self._scan_future is not None and not self._scan_future.done():
+            return
+        # Update UI state; show the last scan instantly while probing
         try:
             self.win.btn_scan_cam.setEnabled(False)
             self.win.btn_use_cam.setEnabled(False)
-            self.win.cmb_cameras.clear()
+            self._fill_camera_combo(self.settings.camera_scan_cache())
         except Exception:
             pass
-        indices = []
-        seen = set()
-        backends = [
-            ("MSMF", getattr(cv2, "CAP_MSMF", None)),
-            ("DShow", getattr(cv2, "CAP_DSHOW", None)),
-            ("Any", getattr(cv2, "CAP_ANY", None)),
-        ]
-        backends = [(n, b) for (n, b) in backends if b is not None]
-        for i in range(0, 11):
-            for (be_name, be) in backends:
-                try:
-                    cap = cv2.VideoCapture(i, be)
-                    ok = bool(cap is not None and cap.isOpened())
-                    if ok and i not in seen:
-                        # Try to read some diagnostics
-                        try:
-                            aw = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                            ah = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                            fps = cap.get(cv2.CAP_PROP_FPS)
-                            fps_txt = f"{fps:.0f}" if isinstance(fps, (int, float)) and fps > 0 else "?"
-                            label = f"Camera {i} — {aw}x{ah} @ {fps_txt} [{be_name}]"
-                        except Exception:
-                            label = f"Camera {i} [{be_name}]"
-                        self.win.cmb_cameras.addItem(label, userData=i)
-                        indices.append(i)
-                        seen.add(i)
-                        break
-                finally:
-                    try:
-                        if cap is not None:
-                            cap.release()
-                    except Exception:
-                        pass
-        # Populate combo
+        # Opening missing devices can block for seconds per backend, so probe
+        # on a worker and hand results back to the GUI thread
+        if self._scan_pool is None:
+            self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="camera-scan")
+        self._scan_future = self._scan_pool.submit(_probe_cameras)
+        QTimer.singleShot(50, self._poll_camera_scan)
+
+    def _poll_camera_scan(self) -> None:
+        fut = self._scan_future
+        if fut is None:
+            return
+        if not fut.done():
+            QTimer.singleShot(50, self._poll_camera_scan)
+            return
+        self._scan_future = None
         try:
-            if not indices:
-                self.win.cmb_cameras.addItem("No cameras found")
-                self.win.btn_use_cam.setEnabled(False)
-            else:
-                for i in indices:
-                    self.win.cmb_cameras.addItem(f"Camera {i}", userData=i)
-                cur = self.settings.camera_index()
-                idx = self.win.cmb_cameras.findData(cur)
-                if idx >= 0:
-                    self.win.cmb_cameras.setCurrentIndex(idx)
-                self.win.btn_use_cam.setEnabled(True)
+            found = fut.result()
+        except Exception:
+            found = []
+        try:
+            self.settings.set_camera_scan_cache(found)
+            self._save_settings_later()
+        except Exception:
+            pass
+        try:
+            self._fill_camera_combo(found)
         finally:
             try:
                 self.win.btn_scan_cam.setEnabled(True)
             except Exception:
                 pass
 
+    def _fill_camera_combo(self, found: list[tuple[int, str]]) -> None:
+        self.win.cmb_cameras.clear()
+        if not found:
+            self.win.cmb_cameras.addItem("No cameras found")
+            self.win.btn_use_cam.setEnabled(False)
+            return
+        for (i, label) in found:
+            self.win.cmb_cameras.addItem(label, userData=i)
+        idx = self.win.cmb_cameras.findData(self.settings.camera_index())
+        if idx >= 0:
+            self.win.cmb_cameras.setCurrentIndex(idx)
+        self.win.btn_use_cam.setEnabled(True)
+
     def _use_selected_camera_main(self) -> None:
         try:
             data = self.win.cmb_cameras.currentData()
@@ -487,7 +665,7 @@ class AppCore:
             # Persist and restart handled by callback + restart
             try:
                 self.settings.set_camera_index(new_idx)
-                self.settings.save()
+                self._save_settings_later()
             except Exception:
                 pass
         except Exception as e:
@@ -508,30 +686,29 @@ class AppCore:
         try:
             self._cam_settings_wnd = CameraSettingsWindow(self._cam_controller, self.settings)
             self._cam_settings_wnd.closed.connect(self._on_cam_settings_closed)  # type: ignore[attr-defined]
+            self._cam_fps_label = getattr(self._cam_settings_wnd, "lbl_current_fps", None)
             self._cam_settings_wnd.show()
         except Exception:
             self._cam_settings_wnd = None
+            self._cam_fps_label = None
 
     def _on_cam_settings_closed(self) -> None:
         self._settings_dialog_open = False
         self._cam_settings_wnd = None
+        self._cam_fps_label = None
 
     # Calibration -------------------------------------------------------
     def start_calibration(self, points: int) -> None:
-        # Pause cursor movement during calibration but keep camera running
+        # Pause cursor movement during calibration but keep camera running;
+        # the timer keeps feeding frames, which calibration samples from
         if self.tracking:
             self.tracking = False
-            try:
-                self.timer.stop()
-            except Exception:
-                pass
-            # Close panic overlay if visible
+            # Hide panic overlay if visible
             if self._panic_overlay is not None:
                 try:
-                    self._panic_overlay.close()
+                    self._panic_overlay.hide()
                 except Exception:
                     pass
-                self._panic_overlay = None
             # Keep pipeline running so we can capture frames for calibration
         # Ensure camera/pipeline is running for calibration sampling
         if not bool(self.pipeline.running):
@@ -543,7 +720,14 @@ class AppCore:
                 except Exception:
                     print(f"Cannot start camera for calibration: {e}")
                 return
+        try:
+            if not bool(self.timer.isActive()):
+                self.timer.start()
+        except Exception:
+            pass
         self.pipeline.map.set_calibrating(True)
+        # A fresh calibration supersedes any pending deferred load
+        self._calib_loaded = True
         # Apply robust settings from UI, if available
         try:
             robust_on = bool(getattr(self.win, "chk_robust").isChecked())
@@ -554,14 +738,18 @@ class AppCore:
                 self.settings.set_calib_robust_enabled(robust_on)
                 self.settings.set_calib_robust_drop_percent(pct)
                 self.settings.set_calib_threshold_px(thr)
-                self.settings.save()
+                self._save_settings_later()
             except Exception:
                 pass
+            # A threshold beyond the screen diagonal can never be exceeded
+            self._calib_threshold_px = min(thr, self._screen_diag)
         except Exception:
             robust_on = self.settings.calib_robust_enabled()
             pct = self.settings.calib_robust_drop_percent()
         try:
             self.pipeline.map.calib.configure_robust(robust_on, drop_percent=pct)
+            # A loaded calibration keeps its saved method; a new one uses the setting
+            self.pipeline.map.calib.method = self.settings.calib_method()
         except Exception:
             pass
         self.pipeline.map.calib.reset()
@@ -569,14 +757,22 @@ class AppCore:
         self._calibration_samples_pred.clear()
         self._calibration_features.clear()
         self._calib_recent_feats.clear()
-        self._calibration_ui = CalibrationUI(points_count=points, samples_per_point=25, dwell_ms=1500)
-        self._calibration_ui.sampleRequested.connect(self._on_calib_sample)  # type: ignore[attr-defined]
-        self._calibration_ui.calibrationFinished.connect(self._on_calib_finished)  # type: ignore[attr-defined]
+        # Build the fullscreen UI once; later runs reconfigure the same widget,
+        # so its signals stay connected exactly once
+        if self._calibration_ui is None:
+            self._calibration_ui = CalibrationUI(points_count=points, samples_per_point=25, dwell_ms=1500)
+            self._calibration_ui.sampleRequested.connect(self._on_calib_sample)  # type: ignore[attr-defined]
+            self._calibration_ui.calibrationFinished.connect(self._on_calib_finished)  # type: ignore[attr-defined]
+        else:
+            self._calibration_ui.reset(points_count=points, samples_per_point=25, dwell_ms=1500)
         self._calibration_ui.start()
 
     def _on_calib_sample(self, target_xy):  # type: ignore[override]
-        # Grab current frame features to sample gaze
-        res = self.pipeline.process()
+        # Sample gaze from the newest processed frame, each frame at most once
+        res = self._last_res
+        if res is None or self._res_seq == self._calib_res_seq:
+            return
+        self._calib_res_seq = self._res_seq
         if res.features is None:
             return
         f = (float(res.features.nx), float(res.features.ny))
@@ -610,26 +806,28 @@ class AppCore:
         self.pipeline.map.train()
         # Save trained calibration to JSON
         try:
-            calib_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "calibration_state.json")
-            self.pipeline.map.calib.save(calib_path)
+            self.pipeline.map.calib.save(_CALIB_PATH)
         except Exception:
             pass
         # Replace predicted points with final model predictions for accuracy
-        feats = self._calibration_features
-        trues = self._calibration_samples_true
+        feats = np.asarray(self._calibration_features, dtype=float).reshape(-1, 2)
+        trues = np.asarray(self._calibration_samples_true, dtype=int).reshape(-1, 2)
         # If calibrator performed outlier filtering, evaluate on inliers only
         try:
             mask = getattr(self.pipeline.map.calib, "last_inlier_mask", None)
             if mask is not None and len(mask) == len(feats):
-                feats = [f for f, m in zip(feats, mask) if m]
-                trues = [t for t, m in zip(trues, mask) if m]
+                keep = np.asarray(mask, dtype=bool)
+                feats = feats[keep]
+                trues = trues[keep]
         except Exception:
             pass
-        final_preds: list[tuple[int, int]] = [self.pipeline.map.predict(f) for f in feats]
+        # One batched model call instead of a predict per sample
+        try:
+            final_preds = self.pipeline.map.predict_batch(feats)
+        except Exception:
+            final_preds = np.asarray([self.pipeline.map.predict((f[0], f[1])) for f in feats], dtype=int).reshape(-1, 2)
         # Show plots window using threshold from settings
-        screen_w, screen_h = self._screen_size()
-        thr = float(self.settings.calib_threshold_px())
-        plots = CalibrationPlotsWindow((screen_w, screen_h), trues, final_preds, threshold_px=thr)
+        plots = CalibrationPlotsWindow((self._screen_w, self._screen_h), trues, final_preds, threshold_px=self._calib_threshold_px)
         # If inlier filtering happened, hint it in the title
         try:
             total = len(self._calibration_features)
@@ -681,59 +879,63 @@ class AppCore:
             pts = getattr(self._calibration_ui, "_requested_points", 5)
             self.start_calibration(points=pts)
 
-    def _on_tick(self) -> None:
-        # Process a frame
-        res = self.pipeline.process()
-        self.fps.tick()
+    def _schedule_work(self) -> None:
+        if self._proc_busy or not self.pipeline.frame_ready():
+            return
+        self._proc_busy = True
+        QMetaObject.invokeMethod(self._proc_worker, "process_latest", Qt.ConnectionType.QueuedConnection)
 
-        # Update UI
-        if res.frame is not None:
-            self.win.update_video(frame=res.frame, landmarks=(res.features.landmarks if res.features else None), iris=(res.features.iris_center if res.features else None), box=(res.features.eyelid_box if res.features else None), predicted=res.predicted_xy)
-        conf = 1.0 if (res.features is not None) else 0.0
-        self.win.update_status(face_ok=res.face_ok, eye_ok=res.eye_ok, conf=conf, fps=self.fps.fps())
+    def _on_result(self, res: Optional[FrameResult]) -> None:
+        self._proc_busy = False
+        if res is None:
+            return
+        self._last_res = res
+        self._res_seq += 1
+        self._fps_tick()
+        feats = res.features
+
+        # Update UI; skip the QImage upload when this frame is already shown
+        if self._win_visible and res.frame is not None and res.frame_id != self._last_uploaded_frame_id:
+            self._last_uploaded_frame_id = res.frame_id
+            if feats is not None:
+                self._update_video(frame=res.frame, landmarks=feats.landmarks, iris=feats.iris_center, box=feats.eyelid_box, predicted=res.predicted_xy)
+            else:
+                self._update_video(frame=res.frame, predicted=res.predicted_xy)
+        now = time.perf_counter()
+        status_due = now >= self._status_next_t
+        if status_due:
+            conf = 1.0 if (feats is not None) else 0.0
+            self._update_status(face_ok=res.face_ok, eye_ok=res.eye_ok, conf=conf, fps=self.fps.fps())
+            self._status_next_t = now + 0.2
 
         # Live signal indicator from recent (nx, ny)
-        try:
-            if res.features is not None:
-                self._sig_hist.append((float(res.features.nx), float(res.features.ny)))
-            if len(self._sig_hist) >= 30:
-                xs = [p[0] for p in self._sig_hist]
-                ys = [p[1] for p in self._sig_hist]
-                rx = max(xs) - min(xs)
-                ry = max(ys) - min(ys)
-                # Thresholds from settings (normalized units)
-                if rx >= self._sig_thr_x_strong and ry >= self._sig_thr_y_strong:
-                    q = "Strong"
-                elif rx >= self._sig_thr_x_ok and ry >= self._sig_thr_y_ok:
-                    q = "OK"
-                else:
-                    q = "Weak"
-                self.win.update_signal(rx=rx, ry=ry, quality=q)
-        except Exception:
-            pass
+        if feats is not None:
+            self._sig_x.push(feats.nx)
+            self._sig_y.push(feats.ny)
+        if status_due and len(self._sig_x) >= 30:
+            rx = self._sig_x.range()
+            ry = self._sig_y.range()
+            # Thresholds from settings (normalized units)
+            if rx >= self._sig_thr_x_strong and ry >= self._sig_thr_y_strong:
+                q = "Strong"
+            elif rx >= self._sig_thr_x_ok and ry >= self._sig_thr_y_ok:
+                q = "OK"
+            else:
+                q = "Weak"
+            self._update_signal(rx=rx, ry=ry, quality=q)
 
-        # Move cursor if available and tracking
-        if (not self._settings_dialog_open) and self.tracking and res.predicted_xy is not None:
-            x, y = res.predicted_xy
-            try:
-                self.cursor.move_cursor(x, y)
-            except Exception:
-                pass
+        # Move cursor if available and tracking (CursorController swallows backend errors)
+        if self._can_move and res.predicted_xy is not None and now >= self._cursor_next_t:
+            self._cursor_next_t = now + 0.03
+            self._cursor_move(*res.predicted_xy)
 
         # During calibration, update the fullscreen UI with a live crosshair
-        try:
-            if self._calibration_ui is not None:
-                self._calibration_ui.set_live_gaze(res.predicted_xy)
-        except Exception:
-            pass
+        if self._calibration_ui is not None and self._calibration_ui.isVisible():
+            self._calibration_ui.set_live_gaze(res.predicted_xy)
 
         # Update camera settings diagnostics FPS label if window open
-        try:
-            if self._cam_settings_wnd is not None:
-                fps_val = self.fps.fps()
-                self._cam_settings_wnd.lbl_current_fps.setText(f"Current FPS: {fps_val:.1f}")
-        except Exception:
-            pass
+        if status_due and self._cam_fps_label is not None:
+            self._cam_fps_label.setText(f"Current FPS: {self.fps.fps():.1f} (dropped frames: {self.pipeline.dropped})")
 
 
 def main() -> int:
@@ -744,7 +946,13 @@ def main() -> int:
     core = AppCore()
     core.win.show()
     code = app.exec()
+    core._flush_settings()
     try:
+        core.timer.stop()
+        core._proc_thread.quit()
+        core._proc_thread.wait(2000)
+        if core._scan_pool is not None:
+            core._scan_pool.shutdown(wait=False, cancel_futures=True)
         core.pipeline.stop()
         if cv2 is not None:
             cv2.destroyAllWindows()
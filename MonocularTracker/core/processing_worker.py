@@ -0,0 +1,33 @@
+"""
+Frame processing off the GUI thread.
+
+The GUI timer asks the worker for a frame via a queued call; the worker runs
+``Pipeline.process()`` on its own QThread and hands the FrameResult back with
+a signal, so detection cost never blocks repaints or input handling.
+"""
+from __future__ import annotations
+
+try:
+    from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+except Exception:  # pragma: no cover
+    QObject = object  # type: ignore
+    QThread = None  # type: ignore
+    pyqtSignal = lambda *a, **k: None  # type: ignore
+    pyqtSlot = lambda *a, **k: (lambda f: f)  # type: ignore
+
+
+class ProcessingWorker(QObject):  # type: ignore[misc]
+    resultReady = pyqtSignal(object)  # FrameResult
+
+    def __init__(self, pipeline) -> None:
+        super().__init__()
+        self.pipeline = pipeline
+
+    @pyqtSlot()
+    def process_latest(self) -> None:
+        try:
+            res = self.pipeline.process()
+        except Exception:
+            res = None
+        # Always answer, so the caller's in-flight flag is released
+        self.resultReady.emit(res)
@@ -5,9 +5,52 @@ Loads/saves JSON settings from MonocularTracker/settings.json and exposes helper
 """
 from __future__ import annotations
 
+import copy
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson  # type: ignore
+
+    def _loads(b: bytes):
+        return orjson.loads(b)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except Exception:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore
+
+    def _loads(b: bytes):
+        return json.loads(b)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Parsed settings files keyed by path: (mtime_ns, data). Instances get deep
+# copies, so mutating one manager's data never leaks into the cache.
+_FILE_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _resolution(v) -> tuple[int, int]:
+    return int(v[0]), int(v[1])
+
+
+# Camera keys shared by profiles and the "camera" section: (default, converter)
+_CAM_FIELDS: Dict[str, tuple] = {
+    "resolution": ([1280, 720], _resolution),
+    "fps": (30, int),
+    "auto_exposure": (True, bool),
+    "exposure": (0.0, float),
+    "gain": (0.0, float),
+    "brightness": (0.0, float),
+    "contrast": (0.0, float),
+    "auto_wb": (True, bool),
+    "wb_temperature": (4500, int),
+    "auto_focus": (True, bool),
+    "focus": (0.0, float),
+}
 
 
 class SettingsManager:
@@ -19,7 +62,11 @@ class SettingsManager:
         self.load()
 
     def load(self) -> None:
-        if not os.path.exists(self.path):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is None:
             # provide minimal defaults
             self.data = {
                 "camera_index": 0,
@@ -55,13 +102,38 @@ class SettingsManager:
                 "camera_profiles": {},
                 "drift": {"enabled": True, "learn_rate": 0.01},
             }
+            self._bind_sections()
             return
-        with open(self.path, "r", encoding="utf-8") as f:
-            self.data = json.load(f)
+        cached = _FILE_CACHE.get(self.path)
+        if cached is not None and cached[0] == mtime:
+            # Unchanged on disk since the last load/save in this process
+            self.data = copy.deepcopy(cached[1])
+        else:
+            with open(self.path, "rb") as f:
+                self.data = _loads(f.read())
+            _FILE_CACHE[self.path] = (mtime, copy.deepcopy(self.data))
+        self._bind_sections()
 
     def save(self) -> None:
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        with open(self.path, "wb") as f:
+            f.write(_dumps(self.data))
+        try:
+            _FILE_CACHE[self.path] = (os.stat(self.path).st_mtime_ns, copy.deepcopy(self.data))
+        except OSError:
+            _FILE_CACHE.pop(self.path, None)
+
+    def _bind_sections(self) -> None:
+        """Hold direct references to each top-level section (created if missing)."""
+        d = self.data
+        self._smoothing = d.setdefault("smoothing", {})
+        self._gaze = d.setdefault("gaze", {})
+        self._calibration = d.setdefault("calibration", {})
+        self._eye = d.setdefault("eye", {})
+        self._overlay = d.setdefault("overlay", {})
+        self._camera = d.setdefault("camera", {})
+        self._drift = d.setdefault("drift", {})
+        self._signal = d.setdefault("signal", {})
+        self._rebuild_cache()
 
     # Convenience accessors -------------------------------------------------
     def camera_index(self) -> int:
@@ -69,6 +141,8 @@ class SettingsManager:
 
     def set_camera_index(self, idx: int) -> None:
         self.data["camera_index"] = int(idx)
+        # Effective camera values come from the new index's profile
+        self._rebuild_cache()
 
     def _profile(self) -> dict:
         """Return (and create) the profile dict for current camera index."""
@@ -81,64 +155,77 @@ class SettingsManager:
         return prof
 
     def smoothing_alpha(self) -> float:
-        return float(self.data.get("smoothing", {}).get("alpha", 0.25))
+        return float(self._smoothing.get("alpha", 0.25))
 
     # Gaze engine ------------------------------------------------------
     def gaze_engine(self) -> str:
-        return str(self.data.get("gaze", {}).get("engine", "landmark"))
+        return str(self._gaze.get("engine", "landmark"))
 
     def set_gaze_engine(self, engine: str) -> None:
-        self.data.setdefault("gaze", {})["engine"] = str(engine)
+        self._gaze["engine"] = str(engine)
 
     # Calibration settings --------------------------------------------
+    def calib_method(self) -> str:
+        """Calibrator method for the "regressor" section: 'poly2', 'poly3' or 'mlp'."""
+        r = self.data.get("regressor", {})
+        if not isinstance(r, dict):
+            return "poly2"
+        kind = str(r.get("type", "poly")).lower()
+        if kind == "mlp":
+            return "mlp"
+        try:
+            return "poly3" if int(r.get("degree", 2)) >= 3 else "poly2"
+        except Exception:
+            return "poly2"
+
     def calib_threshold_px(self) -> float:
-        return float(self.data.get("calibration", {}).get("threshold_px", 150.0))
+        return float(self._calibration.get("threshold_px", 150.0))
 
     def set_calib_threshold_px(self, v: float) -> None:
-        self.data.setdefault("calibration", {})["threshold_px"] = float(v)
+        self._calibration["threshold_px"] = float(v)
 
     def calib_robust_drop_percent(self) -> float:
-        return float(self.data.get("calibration", {}).get("robust_drop_percent", 25.0))
+        return float(self._calibration.get("robust_drop_percent", 25.0))
 
     def set_calib_robust_drop_percent(self, v: float) -> None:
-        self.data.setdefault("calibration", {})["robust_drop_percent"] = float(v)
+        self._calibration["robust_drop_percent"] = float(v)
 
     def calib_robust_enabled(self) -> bool:
-        return bool(self.data.get("calibration", {}).get("robust_enabled", True))
+        return bool(self._calibration.get("robust_enabled", True))
 
     def set_calib_robust_enabled(self, on: bool) -> None:
-        self.data.setdefault("calibration", {})["robust_enabled"] = bool(on)
+        self._calibration["robust_enabled"] = bool(on)
 
     # Eye selection ---------------------------------------------------
     def eye_mode(self) -> str:
-        return str(self.data.get("eye", {}).get("mode", "auto"))
+        return str(self._eye.get("mode", "auto"))
 
     def set_eye_mode(self, mode: str) -> None:
-        self.data.setdefault("eye", {})["mode"] = str(mode)
+        self._eye["mode"] = str(mode)
 
     def show_overlay(self) -> bool:
-        return bool(self.data.get("overlay", {}).get("enabled", True))
+        return bool(self._overlay.get("enabled", True))
 
     def show_camera_window(self) -> bool:
-        return bool(self.data.get("camera", {}).get("show_window", True))
+        return bool(self._camera.get("show_window", True))
 
     def drift_enabled(self) -> bool:
-        return bool(self.data.get("drift", {}).get("enabled", True))
+        return bool(self._drift.get("enabled", True))
 
     def drift_learn_rate(self) -> float:
-        return float(self.data.get("drift", {}).get("learn_rate", 0.01))
+        return float(self._drift.get("learn_rate", 0.01))
 
     # Signal indicator settings --------------------------------------
     def signal_window(self) -> int:
         try:
-            return int(self.data.get("signal", {}).get("window", 90))
+            return int(self._signal.get("window", 90))
         except Exception:
             return 90
 
     def signal_thresholds(self) -> tuple[float, float, float, float]:
-        s = self.data.get("signal", {})
-        ok = s.get("ok", {}) if isinstance(s, dict) else {}
-        strong = s.get("strong", {}) if isinstance(s, dict) else {}
+        s = self._signal
+        ok = s.get("ok", {})
+        strong = s.get("strong", {})
         x_ok = float(ok.get("rx", 0.08))
         y_ok = float(ok.get("ry", 0.05))
         x_strong = float(strong.get("rx", 0.15))
@@ -146,114 +233,103 @@ class SettingsManager:
         return (x_ok, x_strong, y_ok, y_strong)
 
     # Camera settings ---------------------------------------------------
+    # Effective values (per-camera profile over the "camera" section) are
+    # resolved once into self._cache; getters are plain dict reads and
+    # setters update profile, section and cache together.
+    def _rebuild_cache(self) -> None:
+        self._profile_cache = self._profile()
+        cam = self._camera
+        cache: Dict[str, Any] = {}
+        for key, (default, conv) in _CAM_FIELDS.items():
+            v = self._profile_cache.get(key)
+            if v is None:
+                v = cam.get(key, default)
+            try:
+                cache[key] = conv(v)
+            except Exception:
+                cache[key] = conv(default)
+        self._cache = cache
+
+    def _set_cam(self, key: str, stored: Any, effective: Any) -> None:
+        self._profile_cache[key] = stored
+        self._camera[key] = stored
+        self._cache[key] = effective
+
     def camera_resolution(self) -> tuple[int, int]:
-        # Prefer per-camera profile
-        arr = self._profile().get("resolution") or self.data.get("camera", {}).get("resolution", [1280, 720])
-        try:
-            return int(arr[0]), int(arr[1])
-        except Exception:
-            return 1280, 720
+        return self._cache["resolution"]
 
     def set_camera_resolution(self, w: int, h: int) -> None:
-        self._profile()["resolution"] = [int(w), int(h)]
-        self.data.setdefault("camera", {})["resolution"] = [int(w), int(h)]
+        self._set_cam("resolution", [int(w), int(h)], (int(w), int(h)))
 
     def camera_fps(self) -> int:
-        v = self._profile().get("fps")
-        if v is None:
-            v = self.data.get("camera", {}).get("fps", 30)
-        return int(v)
+        return self._cache["fps"]
 
     def set_camera_fps(self, fps: int) -> None:
-        self._profile()["fps"] = int(fps)
-        self.data.setdefault("camera", {})["fps"] = int(fps)
+        self._set_cam("fps", int(fps), int(fps))
 
     def camera_auto_exposure(self) -> bool:
-        v = self._profile().get("auto_exposure")
-        if v is None:
-            v = self.data.get("camera", {}).get("auto_exposure", True)
-        return bool(v)
+        return self._cache["auto_exposure"]
 
     def set_camera_auto_exposure(self, on: bool) -> None:
-        self._profile()["auto_exposure"] = bool(on)
-        self.data.setdefault("camera", {})["auto_exposure"] = bool(on)
+        self._set_cam("auto_exposure", bool(on), bool(on))
 
     def camera_exposure(self) -> float:
-        v = self._profile().get("exposure")
-        if v is None:
-            v = self.data.get("camera", {}).get("exposure", 0.0)
-        return float(v)
+        return self._cache["exposure"]
 
     def set_camera_exposure(self, v: float) -> None:
-        self._profile()["exposure"] = float(v)
-        self.data.setdefault("camera", {})["exposure"] = float(v)
+        self._set_cam("exposure", float(v), float(v))
 
     def camera_gain(self) -> float:
-        v = self._profile().get("gain")
-        if v is None:
-            v = self.data.get("camera", {}).get("gain", 0.0)
-        return float(v)
+        return self._cache["gain"]
 
     def set_camera_gain(self, v: float) -> None:
-        self._profile()["gain"] = float(v)
-        self.data.setdefault("camera", {})["gain"] = float(v)
+        self._set_cam("gain", float(v), float(v))
 
     def camera_brightness(self) -> float:
-        v = self._profile().get("brightness")
-        if v is None:
-            v = self.data.get("camera", {}).get("brightness", 0.0)
-        return float(v)
+        return self._cache["brightness"]
 
     def set_camera_brightness(self, v: float) -> None:
-        self._profile()["brightness"] = float(v)
-        self.data.setdefault("camera", {})["brightness"] = float(v)
+        self._set_cam("brightness", float(v), float(v))
 
     def camera_contrast(self) -> float:
-        v = self._profile().get("contrast")
-        if v is None:
-            v = self.data.get("camera", {}).get("contrast", 0.0)
-        return float(v)
+        return self._cache["contrast"]
 
     def set_camera_contrast(self, v: float) -> None:
-        self._profile()["contrast"] = float(v)
-        self.data.setdefault("camera", {})["contrast"] = float(v)
+        self._set_cam("contrast", float(v), float(v))
 
     def camera_auto_wb(self) -> bool:
-        v = self._profile().get("auto_wb")
-        if v is None:
-            v = self.data.get("camera", {}).get("auto_wb", True)
-        return bool(v)
+        return self._cache["auto_wb"]
 
     def set_camera_auto_wb(self, on: bool) -> None:
-        self._profile()["auto_wb"] = bool(on)
-        self.data.setdefault("camera", {})["auto_wb"] = bool(on)
+        self._set_cam("auto_wb", bool(on), bool(on))
 
     def camera_wb_temperature(self) -> int:
-        v = self._profile().get("wb_temperature")
-        if v is None:
-            v = self.data.get("camera", {}).get("wb_temperature", 4500)
-        return int(v)
+        return self._cache["wb_temperature"]
 
     def set_camera_wb_temperature(self, t: int) -> None:
-        self._profile()["wb_temperature"] = int(t)
-        self.data.setdefault("camera", {})["wb_temperature"] = int(t)
+        self._set_cam("wb_temperature", int(t), int(t))
 
     def camera_auto_focus(self) -> bool:
-        v = self._profile().get("auto_focus")
-        if v is None:
-            v = self.data.get("camera", {}).get("auto_focus", True)
-        return bool(v)
+        return self._cache["auto_focus"]
 
     def set_camera_auto_focus(self, on: bool) -> None:
-        self._profile()["auto_focus"] = bool(on)
-        self.data.setdefault("camera", {})["auto_focus"] = bool(on)
+        self._set_cam("auto_focus", bool(on), bool(on))
 
     def camera_focus(self) -> float:
-        v = self._profile().get("focus")
-        if v is None:
-            v = self.data.get("camera", {}).get("focus", 0.0)
-        return float(v)
+        return self._cache["focus"]
 
     def set_camera_focus(self, v: float) -> None:
-        self._profile()["focus"] = float(v)
-        self.data.setdefault("camera", {})["focus"] = float(v)
+        self._set_cam("focus", float(v), float(v))
+
+    # Last camera scan, shown instantly while a fresh scan runs
+    def camera_scan_cache(self) -> list[tuple[int, str]]:
+        out: list[tuple[int, str]] = []
+        for item in self._camera.get("scan_cache", []) or []:
+            try:
+                out.append((int(item[0]), str(item[1])))
+            except Exception:
+                continue
+        return out
+
+    def set_camera_scan_cache(self, found: list[tuple[int, str]]) -> None:
+        self._camera["scan_cache"] = [[int(i), str(label)] for (i, label) in found]
@@ -19,7 +19,7 @@ Further improvements (TODO):
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple
 
 try:
     import cv2  # type: ignore
@@ -33,9 +33,11 @@ except Exception:  # pragma: no cover
 
 RIGHT_IRIS_IDX = [474, 475, 476, 477]
 RIGHT_EYE_LANDMARKS = [33, 133, 159, 145]  # eyelid bounding landmarks
+# Landmarks read each frame, shared by all parsers: iris first, then lids
+_EYE_IDX = tuple(RIGHT_IRIS_IDX + RIGHT_EYE_LANDMARKS)
 
 
-@dataclass
+@dataclass(slots=True)
 class GazeFeatures:
     iris_center: Tuple[float, float]
     eyelid_box: Tuple[int, int, int, int]
@@ -55,33 +57,35 @@ class GazeParser:
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5,
         )
+        # RGB conversion target, reused across frames of the same shape
+        self._rgb_buf = None
 
     def process(self, frame, debug: bool = False) -> Optional[GazeFeatures]:  # frame is a BGR numpy array
         if cv2 is None or np is None:
             return None
         h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = self._mesh.process(rgb)
+        buf = self._rgb_buf
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = self._rgb_buf = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+        res = self._mesh.process(buf)
         if not res.multi_face_landmarks:
             return None
         face = res.multi_face_landmarks[0]
-        pts = face.landmark
+        xy = self._gather_points(face.landmark, _EYE_IDX, w, h)
+        if xy is None:
+            return None
+        iris_coords = xy[:4]
+        eye_coords = xy[4:]
 
         # Iris center (average of iris landmarks)
-        iris_coords = self._gather_points(pts, RIGHT_IRIS_IDX, w, h)
-        if len(iris_coords) < 2:  # require at least 2 points to form a center
-            return None
-        cx = sum(p[0] for p in iris_coords) / len(iris_coords)
-        cy = sum(p[1] for p in iris_coords) / len(iris_coords)
+        cx, cy = (float(v) for v in iris_coords.mean(axis=0))
 
-        # Eyelid bounding box from chosen eye landmarks
-        eye_coords = self._gather_points(pts, RIGHT_EYE_LANDMARKS, w, h)
-        if len(eye_coords) < 2:
-            return None
-        xs = [p[0] for p in eye_coords]
-        ys = [p[1] for p in eye_coords]
-        x1, x2 = int(min(xs)), int(max(xs))
-        y1, y2 = int(min(ys)), int(max(ys))
+        # Eyelid bounding box from chosen eye landmarks; the same extents feed the EAR
+        lo = eye_coords.min(axis=0)
+        hi = eye_coords.max(axis=0)
+        x1, y1 = int(lo[0]), int(lo[1])
+        x2, y2 = int(hi[0]), int(hi[1])
         # Expand a little margin
         margin = 2
         x1 = max(0, x1 - margin)
@@ -98,7 +102,7 @@ class GazeParser:
         nx = float(max(0.0, min(1.0, nx)))
         ny = float(max(0.0, min(1.0, ny)))
 
-        ear = self._compute_simple_ear(eye_coords)
+        ear = self._compute_simple_ear(hi - lo)
 
         features = GazeFeatures(
             iris_center=(cx, cy),
@@ -113,29 +117,23 @@ class GazeParser:
         return features
 
     @staticmethod
-    def _gather_points(pts, indices: List[int], w: int, h: int) -> List[Tuple[float, float]]:
-        out: List[Tuple[float, float]] = []
-        for i in indices:
-            try:
-                p = pts[i]
-            except IndexError:
-                continue
-            out.append((p.x * w, p.y * h))
-        return out
+    def _gather_points(pts, indices, w: int, h: int):
+        """Gather the given landmarks into one (N, 2) pixel array, or None if any is missing."""
+        try:
+            xy = np.array([(pts[i].x, pts[i].y) for i in indices], dtype=np.float64)
+        except IndexError:
+            return None
+        xy *= (w, h)
+        return xy
 
     @staticmethod
-    def _compute_simple_ear(eye_coords: List[Tuple[float, float]]) -> Optional[float]:
+    def _compute_simple_ear(extent) -> Optional[float]:
         # Very rough eye aspect ratio proxy: vertical distance between top(159) and bottom(145)
         # divided by horizontal distance between corners (33,133), indices assumed known ordering.
         # For robust blink detection, refine later with proper EAR formula.
-        if len(eye_coords) < 4:
-            return None
-        # Mapping by landmark index to coordinate
-        # We'll just approximate using min/max y for vertical, min/max x for horizontal
-        xs = [c[0] for c in eye_coords]
-        ys = [c[1] for c in eye_coords]
-        horiz = max(xs) - min(xs)
-        vert = max(ys) - min(ys)
+        # ``extent`` is the (width, height) of the eyelid landmarks' bounding box,
+        # i.e. max - min over x for horizontal and over y for vertical
+        horiz, vert = float(extent[0]), float(extent[1])
         if horiz <= 0:
             return None
         return vert / horiz
@@ -1,43 +1,219 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import json
+import math
+import os
+import threading
 from typing import List, Optional, Tuple
 
+from MonocularTracker.core.settings import _dumps, _loads
+
 try:
     import numpy as np  # type: ignore
-    from sklearn.neural_network import MLPRegressor  # type: ignore
-    from sklearn.preprocessing import StandardScaler, PolynomialFeatures  # type: ignore
-    from sklearn.linear_model import Ridge  # type: ignore
-    from sklearn.pipeline import Pipeline as SKPipeline  # type: ignore
 except Exception:  # pragma: no cover
     np = None  # type: ignore
+
+try:
+    from sklearn.neural_network import MLPRegressor  # type: ignore
+    from sklearn.preprocessing import StandardScaler  # type: ignore
+except Exception:  # pragma: no cover
     MLPRegressor = None  # type: ignore
     StandardScaler = None  # type: ignore
-    PolynomialFeatures = None  # type: ignore
-    Ridge = None  # type: ignore
-    SKPipeline = None  # type: ignore
+
+# Training summaries are appended here; None disables file logging
+_LOG_PATH: Optional[str] = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "logs", "calibration.log"
+)
+
+
+def _append_log(msg: str) -> None:
+    if not _LOG_PATH:
+        return
+    try:
+        os.makedirs(os.path.dirname(_LOG_PATH), exist_ok=True)
+        with open(_LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(msg + "\n")
+    except Exception:
+        pass
+
+
+class _PolyRidge:
+    """Standardize -> degree-2/3 polynomial -> ridge, solved in closed form with NumPy.
+
+    Equivalent to sklearn's StandardScaler/PolynomialFeatures/Ridge pipeline
+    without the per-call estimator validation overhead.
+    """
+
+    def __init__(self, alpha: float = 1.0, degree: int = 2) -> None:
+        self.alpha = float(alpha)
+        self.degree = 3 if int(degree) >= 3 else 2
+        self.mean_ = None
+        self.scale_ = None
+        self.coef_ = None
+        self.intercept_ = 0.0
+        # (mean_x, mean_y, scale_x, scale_y, bias, w0..wk) as Python floats
+        self._p: Optional[tuple] = None
+
+    def _design(self, Xs):
+        x, y = Xs[:, 0], Xs[:, 1]
+        xx, xy, yy = x * x, x * y, y * y
+        if self.degree == 2:
+            return np.column_stack((x, y, xx, xy, yy))
+        # Same column order as sklearn PolynomialFeatures(3)
+        return np.column_stack((x, y, xx, xy, yy, xx * x, xx * y, x * yy, yy * y))
+
+    def fit(self, X, y) -> "_PolyRidge":
+        """Fit one target (N,) or several (N, K) against a single design matrix."""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.mean_ = X.mean(axis=0)
+        sd = X.std(axis=0)
+        sd[sd == 0.0] = 1.0
+        self.scale_ = sd
+        return self.refit(X, y)
+
+    def refit(self, X, y) -> "_PolyRidge":
+        """Re-solve the ridge weights on new rows, keeping the fitted standardization."""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        Phi = self._design((X - self.mean_) / self.scale_)
+        # Unpenalized intercept: center, solve (P'P + aI) w = P'y, recover bias
+        pm = Phi.mean(axis=0)
+        ym = y.mean(axis=0)
+        Pc = Phi - pm
+        A = Pc.T @ Pc + self.alpha * np.eye(Pc.shape[1])
+        self.coef_ = np.linalg.solve(A, Pc.T @ (y - ym))
+        b = ym - pm @ self.coef_
+        self.intercept_ = float(b) if np.ndim(b) == 0 else b
+        self._p = None
+        return self
+
+    @classmethod
+    def fit_xy(cls, X, yx, yy, alpha: float = 1.0, degree: int = 2, like: Optional["_PolyRidge"] = None) -> Tuple["_PolyRidge", "_PolyRidge"]:
+        """Fit the x and y models with one standardization, design matrix and solve.
+
+        With ``like``, reuse that model's standardization and only re-solve.
+        """
+        degree = like.degree if like is not None else degree
+        both = cls(alpha, degree)
+        Y = np.column_stack((yx, yy))
+        if like is None:
+            both.fit(X, Y)
+        else:
+            both.mean_, both.scale_ = like.mean_, like.scale_
+            both.refit(X, Y)
+        out = []
+        for j in (0, 1):
+            m = cls(alpha, both.degree)
+            m.mean_, m.scale_ = both.mean_, both.scale_
+            m.coef_ = both.coef_[:, j]
+            m.intercept_ = float(both.intercept_[j])
+            out.append(m)
+        return out[0], out[1]
+
+    def predict(self, X):
+        Xs = (np.asarray(X, dtype=float).reshape(-1, 2) - self.mean_) / self.scale_
+        return self._design(Xs) @ self.coef_ + self.intercept_
+
+    def predict_one(self, f0: float, f1: float) -> float:
+        """Scalar fast path for a single-axis model: no ndarray allocation."""
+        p = self._p
+        if p is None:
+            p = self._p = tuple(float(v) for v in (*self.mean_, *self.scale_, self.intercept_, *self.coef_))
+        x = (f0 - p[0]) / p[2]
+        y = (f1 - p[1]) / p[3]
+        xx, xy, yy = x * x, x * y, y * y
+        r = p[4] + p[5] * x + p[6] * y + p[7] * xx + p[8] * xy + p[9] * yy
+        if self.degree == 3:
+            r += p[10] * xx * x + p[11] * xx * y + p[12] * x * yy + p[13] * yy * y
+        return r
+
+
+def _block_diag(a, b):
+    out = np.zeros((a.shape[0] + b.shape[0], a.shape[1] + b.shape[1]))
+    out[: a.shape[0], : a.shape[1]] = a
+    out[a.shape[0]:, a.shape[1]:] = b
+    return out
 
 
-@dataclass
+def _mlp_forward_layers(mx, my, scaler):
+    """Fuse two fitted MLPRegressors (and their input scaler) into one layer stack.
+
+    Layer 0 stacks both networks side by side on the shared 2-D input with the
+    scaler folded in; deeper layers are block-diagonal, so a single chain of
+    matmuls yields both screen axes. Returns None for non-MLP estimators.
+    """
+    if not (hasattr(mx, "coefs_") and hasattr(my, "coefs_")) or len(mx.coefs_) != len(my.coefs_):
+        return None
+    W0 = np.hstack((mx.coefs_[0], my.coefs_[0]))
+    b0 = np.concatenate((mx.intercepts_[0], my.intercepts_[0]))
+    if scaler is not None:
+        # ((x - mean) / scale) @ W + b  ==  x @ (W / scale) + (b - (mean / scale) @ W)
+        W0s = W0 / scaler.scale_[:, None]
+        b0 = b0 - (scaler.mean_ / scaler.scale_) @ W0
+        W0 = W0s
+    Ws = [W0]
+    bs = [b0]
+    for k in range(1, len(mx.coefs_)):
+        Ws.append(_block_diag(mx.coefs_[k], my.coefs_[k]))
+        bs.append(np.concatenate((mx.intercepts_[k], my.intercepts_[k])))
+    return Ws, bs, mx.activation
+
+
+def _mlp_forward(layers, X):
+    Ws, bs, act = layers
+    H = X
+    last = len(Ws) - 1
+    for k, (W, b) in enumerate(zip(Ws, bs)):
+        H = H @ W
+        H += b
+        if k == last:
+            break  # regressor output layer is identity
+        if act == "tanh":
+            np.tanh(H, out=H)
+        elif act == "relu":
+            np.maximum(H, 0.0, out=H)
+        elif act == "logistic":
+            H = 1.0 / (1.0 + np.exp(-H))
+    return H
+
+
+@dataclass(slots=True)
 class Sample:
     feature: Tuple[float, float]
     screen_xy: Tuple[int, int]
 
 
 class Calibrator:
-    def __init__(self, hidden: Tuple[int, int] = (32, 32), activation: str = "tanh", max_iter: int = 800, method: str = "auto") -> None:
-        if np is None or MLPRegressor is None:
-            raise RuntimeError("scikit-learn and numpy required for calibration")
+    def __init__(self, hidden: Tuple[int, int] = (32, 32), activation: str = "tanh", max_iter: int = 800, method: str = "poly2") -> None:
+        if np is None:
+            raise RuntimeError("numpy required for calibration")
         self.hidden = hidden
         self.activation = activation
         self.max_iter = max_iter
-        self.method = method  # 'mlp' | 'poly2' | 'auto'
-        self.samples: List[Sample] = []
+        # 'poly2' | 'poly3' | 'mlp'; 'auto' is accepted for old files and means poly2
+        self.method = method
+        # Samples as growable column buffers; rows [0, _n) are valid
+        self._n = 0
+        self._X = np.empty((128, 2), dtype=float)
+        self._yx = np.empty(128, dtype=float)
+        self._yy = np.empty(128, dtype=float)
         self.mx: Optional[object] = None  # estimator for X
         self.my: Optional[object] = None  # estimator for Y
         self.scaler: Optional[StandardScaler] = None  # type: ignore[assignment]
         self.is_trained = False
         self.last_inlier_mask: Optional[list[bool]] = None
+        # Fused forward pass for MLP models (see _mlp_forward_layers)
+        self._mlp_layers: Optional[tuple] = None
+        # 1x2 input row reused by predict() on the matrix paths
+        self._input_buf = np.empty((1, 2), dtype=float)
+        # predict() runs on the processing thread while train()/reset() run on
+        # the GUI thread: the model fields above and _input_buf are only
+        # touched under this lock, and train() fits into locals first
+        self._lock = threading.Lock()
+        # (sample count, method, robust config) of the current fit; see train()
+        self._fit_key: Optional[tuple] = None
         # Robust config
         self.robust_enabled: bool = True
         self.robust_drop_percent: float = 25.0  # drop worst N percent (more aggressive)
@@ -45,17 +221,36 @@ class Calibrator:
         self.min_keep_count: int = 20
 
     def reset(self) -> None:
-        self.samples.clear()
-        self.mx = None
-        self.my = None
-        self.scaler = None
-        self.is_trained = False
+        self._n = 0
+        with self._lock:
+            self._mlp_layers = None
+            self.mx = None
+            self.my = None
+            self.scaler = None
+            self.is_trained = False
         self.last_inlier_mask = None
 
     def add(self, f: Tuple[float, float], xy: Tuple[int, int]) -> None:
-        self.samples.append(Sample(f, xy))
+        n = self._n
+        if n == len(self._yx):
+            cap = 2 * n
+            self._X = np.resize(self._X, (cap, 2))
+            self._yx = np.resize(self._yx, cap)
+            self._yy = np.resize(self._yy, cap)
+        self._X[n] = f
+        self._yx[n] = xy[0]
+        self._yy[n] = xy[1]
+        self._n = n + 1
+
+    @property
+    def samples(self) -> List[Sample]:
+        """Snapshot of the collected samples as Sample records."""
+        n = self._n
+        return [Sample((float(x), float(y)), (int(a), int(b))) for (x, y), a, b in zip(self._X[:n], self._yx[:n], self._yy[:n])]
 
     def _train_mlp(self, X, yx, yy):
+        if MLPRegressor is None:
+            raise RuntimeError("scikit-learn required for the MLP calibrator")
         scaler = StandardScaler() if StandardScaler is not None else None
         Xs = scaler.fit_transform(X) if scaler is not None else X
         mx = MLPRegressor(hidden_layer_sizes=self.hidden, activation=self.activation, max_iter=self.max_iter, solver="adam", random_state=42)
@@ -63,34 +258,25 @@ class Calibrator:
         mx.fit(Xs, yx)
         my.fit(Xs, yy)
         # compute simple training error (RMSE)
-        import math
         ex = np.asarray(mx.predict(Xs)) - yx
         ey = np.asarray(my.predict(Xs)) - yy
         rmse = math.sqrt(float(np.mean(ex * ex + ey * ey)))
         return mx, my, scaler, rmse
 
-    def _train_poly2(self, X, yx, yy):
-        # Pipeline: Standardize -> Polynomial(deg2) -> Ridge
-        if SKPipeline is None or PolynomialFeatures is None or Ridge is None:
-            # Fallback to MLP path
-            return self._train_mlp(X, yx, yy)
-        pipe_x = SKPipeline([
-            ("scaler", StandardScaler() if StandardScaler is not None else None),
-            ("poly", PolynomialFeatures(degree=2, include_bias=False)),
-            ("ridge", Ridge(alpha=1.0, random_state=42)),
-        ])
-        pipe_y = SKPipeline([
-            ("scaler", StandardScaler() if StandardScaler is not None else None),
-            ("poly", PolynomialFeatures(degree=2, include_bias=False)),
-            ("ridge", Ridge(alpha=1.0, random_state=42)),
-        ])
-        pipe_x.fit(X, yx)
-        pipe_y.fit(X, yy)
-        import math
-        ex = np.asarray(pipe_x.predict(X)) - yx
-        ey = np.asarray(pipe_y.predict(X)) - yy
+    def _refit_mlp(self, mx, my, scaler, X, yx, yy) -> None:
+        # Resume Adam from the given (not yet published) weights with a short budget
+        Xs = scaler.transform(X) if scaler is not None else X
+        for m, y in ((mx, yx), (my, yy)):
+            m.set_params(warm_start=True, max_iter=100)  # type: ignore[union-attr]
+            m.fit(Xs, y)  # type: ignore[union-attr]
+            m.set_params(warm_start=False, max_iter=self.max_iter)  # type: ignore[union-attr]
+
+    def _train_poly(self, X, yx, yy, degree: int = 2):
+        mx, my = _PolyRidge.fit_xy(X, yx, yy, alpha=1.0, degree=degree)
+        ex = mx.predict(X) - yx
+        ey = my.predict(X) - yy
         rmse = math.sqrt(float(np.mean(ex * ex + ey * ey)))
-        return pipe_x, pipe_y, None, rmse
+        return mx, my, None, rmse
 
     def _compute_errors(self, X, yx, yy, mx, my, scaler=None):
         if scaler is not None:
@@ -116,44 +302,44 @@ class Calibrator:
                 pass
 
     def train(self) -> None:
-        if not self.samples:
+        n = self._n
+        if n == 0:
             return
-        X = np.array([s.feature for s in self.samples], dtype=float)
-        yx = np.array([s.screen_xy[0] for s in self.samples], dtype=float)
-        yy = np.array([s.screen_xy[1] for s in self.samples], dtype=float)
-        # Train candidates and pick the more stable one if method=='auto'
-        if self.method in ("mlp", "auto"):
-            mx_a, my_a, sc_a, rmse_a = self._train_mlp(X, yx, yy)
-        else:
-            mx_a = my_a = sc_a = None  # type: ignore[assignment]
-            rmse_a = float("inf")
-        if self.method in ("poly2", "auto"):
-            mx_b, my_b, sc_b, rmse_b = self._train_poly2(X, yx, yy)
-        else:
-            mx_b = my_b = sc_b = None  # type: ignore[assignment]
-            rmse_b = float("inf")
-
-        if rmse_b < rmse_a:
-            self.mx, self.my, self.scaler, chosen = mx_b, my_b, sc_b, "poly2"
-            base_errs = self._compute_errors(X, yx, yy, mx_b, my_b, sc_b)
+        # Samples are append-only between resets, so an unchanged count (with
+        # the same settings) means the current fit already covers them
+        key = (n, self.method, self.robust_enabled, self.robust_drop_percent)
+        if self.is_trained and key == self._fit_key:
+            return
+        X, yx, yy = self._X[:n], self._yx[:n], self._yy[:n]
+        # The iterative MLP only runs when explicitly requested; a closed-form
+        # polynomial fit is as accurate for this sample count
+        if self.method == "mlp":
+            mx, my, scaler, _ = self._train_mlp(X, yx, yy)
+            chosen = "mlp"
+        elif self.method == "poly3":
+            mx, my, scaler, _ = self._train_poly(X, yx, yy, degree=3)
+            chosen = "poly3"
         else:
-            self.mx, self.my, self.scaler, chosen = mx_a, my_a, sc_a, "mlp"
-            base_errs = self._compute_errors(X, yx, yy, mx_a, my_a, sc_a)
+            mx, my, scaler, _ = self._train_poly(X, yx, yy, degree=2)
+            chosen = "poly2"
+        base_errs = self._compute_errors(X, yx, yy, mx, my, scaler)
         self.method = chosen
         # Robust pass: drop worst N% outliers if enabled and enough samples
         keep_mask = np.ones(len(X), dtype=bool)
         try:
             if self.robust_enabled and len(X) >= 40 and self.robust_drop_percent > 0.0:
+                n = len(base_errs)
                 quant = 1.0 - (self.robust_drop_percent / 100.0)
-                q = float(np.quantile(base_errs, quant))
-                keep_mask = base_errs <= q
+                # Threshold = error of the k-th best sample; the relaxed (+5%)
+                # fallback rank comes out of the same O(n) selection
+                k = max(1, int(round(n * quant)))
+                k_relaxed = max(k, min(n, int(round(n * min(0.98, quant + 0.05)))))
+                part = np.partition(base_errs, [k - 1, k_relaxed - 1])
+                keep_mask = base_errs <= part[k - 1]
                 # Safeguards
-                min_keep = max(int(self.min_keep_frac * len(X)), self.min_keep_count)
+                min_keep = max(int(self.min_keep_frac * n), self.min_keep_count)
                 if keep_mask.sum() < min_keep:
-                    # relax threshold by 5%
-                    quant = min(0.98, quant + 0.05)
-                    q = float(np.quantile(base_errs, quant))
-                    keep_mask = base_errs <= q
+                    keep_mask = base_errs <= part[k_relaxed - 1]
         except Exception:
             pass
         self.last_inlier_mask = [bool(v) for v in keep_mask]
@@ -161,54 +347,53 @@ class Calibrator:
             X2 = X[keep_mask]
             yx2 = yx[keep_mask]
             yy2 = yy[keep_mask]
-            # retrain with same selection logic
-            if self.method in ("mlp",):
-                self.mx, self.my, self.scaler, _ = self._train_mlp(X2, yx2, yy2)
-            elif self.method in ("poly2",):
-                self.mx, self.my, self.scaler, _ = self._train_poly2(X2, yx2, yy2)
-            else:  # auto -> choose again on filtered data
-                mx_a, my_a, sc_a, rmse_a = self._train_mlp(X2, yx2, yy2)
-                mx_b, my_b, sc_b, rmse_b = self._train_poly2(X2, yx2, yy2)
-                if rmse_b < rmse_a:
-                    self.mx, self.my, self.scaler, self.method = mx_b, my_b, sc_b, "poly2"
-                else:
-                    self.mx, self.my, self.scaler, self.method = mx_a, my_a, sc_a, "mlp"
-        self.is_trained = True
+            # Refine the chosen model on the inliers rather than starting over
+            if self.method == "mlp":
+                self._refit_mlp(mx, my, scaler, X2, yx2, yy2)
+            else:
+                mx, my = _PolyRidge.fit_xy(X2, yx2, yy2, alpha=1.0, like=mx)
+        layers = _mlp_forward_layers(mx, my, scaler)
+        # Publish the finished model in one step; predict() never sees a mix
+        with self._lock:
+            self.mx, self.my, self.scaler, self._mlp_layers = mx, my, scaler, layers
+            self.is_trained = True
+        self._fit_key = (n, self.method, self.robust_enabled, self.robust_drop_percent)
         # Log training summary for diagnostics (console + file)
         try:
-            errs = self._compute_errors(X, yx, yy, self.mx, self.my, self.scaler)  # type: ignore[arg-type]
+            errs = self._compute_errors(X, yx, yy, mx, my, scaler)  # type: ignore[arg-type]
             mean_err = float(np.mean(errs))
             max_err = float(np.max(errs))
             msg = f"Calibration: samples={len(X)} method={self.method} mean={mean_err:.2f}px max={max_err:.2f}px"
             print(msg)
-            # File logging
-            try:
-                root = os.path.dirname(os.path.dirname(__file__))  # MonocularTracker/
-                log_dir = os.path.join(root, "logs")
-                os.makedirs(log_dir, exist_ok=True)
-                with open(os.path.join(log_dir, "calibration.log"), "a", encoding="utf-8") as f:
-                    f.write(msg + "\n")
-            except Exception:
-                pass
+            _append_log(msg)
             threshold = 150.0
             if mean_err > threshold:
                 warn = "Calibration warning: calibration unstable — consider recalibrating."
                 print(warn)
-                try:
-                    root = os.path.dirname(os.path.dirname(__file__))
-                    log_dir = os.path.join(root, "logs")
-                    os.makedirs(log_dir, exist_ok=True)
-                    with open(os.path.join(log_dir, "calibration.log"), "a", encoding="utf-8") as f:
-                        f.write(warn + "\n")
-                except Exception:
-                    pass
+                _append_log(warn)
         except Exception:
             pass
 
     def predict(self, f: Tuple[float, float]) -> Tuple[int, int]:
+        with self._lock:
+            return self._predict(f)
+
+    def _predict(self, f: Tuple[float, float]) -> Tuple[int, int]:
         if not self.is_trained or self.mx is None or self.my is None:
             return (0, 0)
-        X = np.array([f], dtype=float)
+        mx, my = self.mx, self.my
+        if type(mx) is _PolyRidge and type(my) is _PolyRidge:
+            # Per-frame path: a dozen float ops instead of two model dispatches
+            f0, f1 = float(f[0]), float(f[1])
+            return int(round(mx.predict_one(f0, f1))), int(round(my.predict_one(f0, f1)))
+        X = self._input_buf
+        X[0, 0] = f[0]
+        X[0, 1] = f[1]
+        layers = self._mlp_layers
+        if layers is not None:
+            # Both axes in one fused forward pass; no sklearn input validation
+            out = _mlp_forward(layers, X)
+            return int(round(out[0, 0])), int(round(out[0, 1]))
         if self.scaler is not None:
             try:
                 X = self.scaler.transform(X)
@@ -224,32 +409,133 @@ class Calibrator:
             py = float(self.my.predict(X)[0])  # type: ignore
         return int(round(px)), int(round(py))
 
+    def predict_batch(self, F) -> "np.ndarray":
+        """Predict an (N, 2) feature array in one model call; returns (N, 2) int pixels."""
+        X = np.asarray(F, dtype=float).reshape(-1, 2)
+        with self._lock:
+            trained = self.is_trained
+            mx, my, scaler, layers = self.mx, self.my, self.scaler, self._mlp_layers
+        if not trained or mx is None or my is None or len(X) == 0:
+            return np.zeros((len(X), 2), dtype=int)
+        if layers is not None:
+            return np.rint(_mlp_forward(layers, X)).astype(int)
+        if scaler is not None:
+            try:
+                X = scaler.transform(X)
+            except Exception:
+                pass
+        px = mx.predict(X)  # type: ignore[arg-type]
+        py = my.predict(X)  # type: ignore[arg-type]
+        return np.rint(np.column_stack((px, py))).astype(int)
+
     # Persistence -------------------------------------------------------
+    @staticmethod
+    def _models_path(path: str) -> str:
+        return os.path.splitext(path)[0] + ".npz"
+
+    def _model_arrays(self) -> dict:
+        mx, my = self.mx, self.my
+        if type(mx) is _PolyRidge and type(my) is _PolyRidge:
+            return {
+                "mean": mx.mean_,
+                "scale": mx.scale_,
+                "coef": np.column_stack((mx.coef_, my.coef_)),
+                "intercept": np.array([mx.intercept_, my.intercept_]),
+            }
+        if not (hasattr(mx, "coefs_") and hasattr(my, "coefs_")):
+            raise RuntimeError(f"Cannot save calibration model of type {type(mx).__name__}")
+        out = {}
+        for tag, m in (("mx", mx), ("my", my)):
+            for k, (W, b) in enumerate(zip(m.coefs_, m.intercepts_)):
+                out[f"{tag}_W{k}"] = W
+                out[f"{tag}_b{k}"] = b
+        if self.scaler is not None:
+            out["sc_mean"] = self.scaler.mean_
+            out["sc_scale"] = self.scaler.scale_
+        return out
+
     def save(self, path: str) -> None:
+        """Write metadata JSON to ``path`` and the model weights (float32 .npz) beside it."""
         if not self.is_trained or self.mx is None or self.my is None:
             raise RuntimeError("Model not trained")
+        models_path = self._models_path(path)
+        # Weights only, as float32: well below a pixel of error after rounding
+        np.savez(models_path, **{k: np.asarray(v, dtype=np.float32) for k, v in self._model_arrays().items()})
         data = {
             "hidden": list(self.hidden),
             "activation": self.activation,
             "max_iter": self.max_iter,
             "method": self.method,
-            "mx_state": self._sanitize(self.mx.__getstate__()),
-            "my_state": self._sanitize(self.my.__getstate__()),
-            "scaler_state": (self._sanitize(self.scaler.__getstate__()) if self.scaler is not None else None),
+            "models": os.path.basename(models_path),
         }
-        import json
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        # Metadata last, so it never names a model file that is not there yet
+        with open(path, "wb") as f:
+            f.write(_dumps(data))
+
+    def _set_model_arrays(self, z) -> None:
+        arr = {k: np.asarray(z[k], dtype=float) for k in z.files}
+        if self.method in ("poly2", "poly3"):
+            degree = 3 if self.method == "poly3" else 2
+            mx, my = _PolyRidge(degree=degree), _PolyRidge(degree=degree)
+            for j, m in enumerate((mx, my)):
+                m.mean_, m.scale_ = arr["mean"], arr["scale"]
+                m.coef_ = arr["coef"][:, j]
+                m.intercept_ = float(arr["intercept"][j])
+            self.mx, self.my, self.scaler = mx, my, None
+            return
+        # MLP: rebuild fitted estimators from their weights
+        models = []
+        for tag in ("mx", "my"):
+            n_layers = sum(1 for k in arr if k.startswith(tag + "_W"))
+            m = MLPRegressor(hidden_layer_sizes=self.hidden, activation=self.activation, max_iter=self.max_iter, solver="adam", random_state=42)
+            m.__setstate__({
+                **m.__dict__,
+                "coefs_": [arr[f"{tag}_W{k}"] for k in range(n_layers)],
+                "intercepts_": [arr[f"{tag}_b{k}"] for k in range(n_layers)],
+                "n_layers_": n_layers + 1,
+                "n_outputs_": 1,
+                "n_features_in_": 2,
+                "out_activation_": "identity",
+            })
+            models.append(m)
+        self.mx, self.my = models
+        self.scaler = None
+        if "sc_mean" in arr and StandardScaler is not None:
+            sc = StandardScaler()
+            sc.__setstate__({
+                **sc.__dict__,
+                "mean_": arr["sc_mean"],
+                "scale_": arr["sc_scale"],
+                "var_": arr["sc_scale"] ** 2,
+                "n_features_in_": 2,
+                "n_samples_seen_": 0,
+            })
+            self.scaler = sc
 
     @classmethod
     def load(cls, path: str) -> "Calibrator":
-        import os, json
-        if not os.path.exists(path):
-            raise FileNotFoundError(path)
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # open() raises FileNotFoundError itself; no separate exists() stat
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            data = _loads(raw)
+        except ValueError:
+            # Older files written by json.dump may hold NaN/Infinity literals
+            data = json.loads(raw)
         inst = cls(hidden=tuple(data.get("hidden", [32, 32])), activation=data.get("activation", "tanh"), max_iter=int(data.get("max_iter", 800)), method=data.get("method", "mlp"))
-        # Recreate placeholders; exact estimator types are restored by __setstate__
+        if "models" in data:
+            with np.load(os.path.join(os.path.dirname(path), data["models"])) as z:
+                inst._set_model_arrays(z)
+            inst._mlp_layers = _mlp_forward_layers(inst.mx, inst.my, inst.scaler)
+            inst.is_trained = True
+            return inst
+        # Older single-file format: MLP estimator state inlined as JSON lists
+        # (earlier versions could only write MLP models in this form).
+        # Recreate placeholders; fitted attributes are restored by __setstate__
+        if inst.method != "mlp":
+            raise ValueError(f"Unsupported calibration file: legacy method {inst.method!r}")
+        if MLPRegressor is None:
+            raise RuntimeError("scikit-learn required to load an MLP calibration")
         inst.mx = MLPRegressor(hidden_layer_sizes=inst.hidden, activation=inst.activation, max_iter=inst.max_iter, solver="adam", random_state=42)
         inst.my = MLPRegressor(hidden_layer_sizes=inst.hidden, activation=inst.activation, max_iter=inst.max_iter, solver="adam", random_state=42)
         state_x = cls._restore(data.get("mx_state", {}))
@@ -263,21 +549,10 @@ class Calibrator:
             inst.scaler.__setstate__(cls._restore(sc_state))
         else:
             inst.scaler = None
+        inst._mlp_layers = _mlp_forward_layers(inst.mx, inst.my, inst.scaler)
         inst.is_trained = True
         return inst
 
-    @staticmethod
-    def _sanitize(state):
-        def conv(v):
-            if isinstance(v, np.ndarray):
-                return v.tolist()
-            if isinstance(v, list):
-                return [conv(x) for x in v]
-            if isinstance(v, dict):
-                return {k: conv(x) for k, x in v.items()}
-            return v
-        return {k: conv(v) for k, v in state.items()}
-
     @staticmethod
     def _restore(state):
         def conv(v):
@@ -288,24 +563,30 @@ class Calibrator:
             if isinstance(v, dict):
                 return {k: conv(x) for k, x in v.items()}
             return v
-        s = {k: conv(v) for k, v in state.items()}
-        # coefs_/intercepts_ arrays
-        for k in ("coefs_", "intercepts_"):
-            if k in s and isinstance(s[k], list):
-                s[k] = [np.array(a, dtype=float) for a in s[k]]
+        s = {}
+        for k, v in state.items():
+            if k in ("coefs_", "intercepts_") and isinstance(v, list):
+                # Per-layer weight lists: one C-level conversion each, no per-float walk
+                s[k] = [np.asarray(a, dtype=float) for a in v]
+            else:
+                s[k] = conv(v)
         return s
 
     def accuracy(self, eval_samples: Optional[List[Sample]] = None) -> Tuple[float, float]:
         """Return (mean_error_px, max_error_px)."""
         if eval_samples is None:
-            eval_samples = self.samples
-        if not eval_samples:
-            return (0.0, 0.0)
-        errs: List[float] = []
-        for s in eval_samples:
-            px, py = self.predict(s.feature)
-            dx = float(px - s.screen_xy[0])
-            dy = float(py - s.screen_xy[1])
-            errs.append((dx * dx + dy * dy) ** 0.5)
-        mean_err = sum(errs) / float(len(errs))
-        return (mean_err, max(errs))
+            n = self._n
+            if n == 0:
+                return (0.0, 0.0)
+            F = self._X[:n]
+            tx, ty = self._yx[:n], self._yy[:n]
+        else:
+            if not eval_samples:
+                return (0.0, 0.0)
+            F = [s.feature for s in eval_samples]
+            Y = np.asarray([s.screen_xy for s in eval_samples], dtype=float)
+            tx, ty = Y[:, 0], Y[:, 1]
+        # One batched model call instead of a predict() per sample
+        P = self.predict_batch(F)
+        d = np.hypot(P[:, 0] - tx, P[:, 1] - ty)
+        return (float(d.mean()), float(d.max()))
@@ -17,39 +17,52 @@ class CameraController:
     It reads/writes values to SettingsManager and attempts to apply to the active
     VideoCapture when available. Resolution/FPS changes are considered "major" and
     should be followed by a camera restart, which is delegated to `restart_callback`.
+
+    When the capture runs on a background thread, pass `with_cap` (e.g.
+    `Camera.with_device`) so every property call is serialized with frame grabs.
     """
 
     RES_PRESETS: List[Tuple[int, int]] = [(640, 480), (1280, 720), (1920, 1080)]
     FPS_PRESETS: List[int] = [15, 30, 60]
 
-    def __init__(self, get_cap: Callable[[], Optional[object]], restart_callback: Callable[[], None], settings: SettingsManager, change_index_callback: Optional[Callable[[int], None]] = None) -> None:
+    def __init__(self, get_cap: Callable[[], Optional[object]], restart_callback: Callable[[], None], settings: SettingsManager, change_index_callback: Optional[Callable[[int], None]] = None, with_cap: Optional[Callable[[Callable[[object], object]], object]] = None) -> None:
         self._get_cap = get_cap
+        self._use_cap = with_cap
         self._restart = restart_callback
         self.settings = settings
         self._change_index = change_index_callback
+        # Probe results per camera index; probing costs several blocking cap.set calls
+        self._supported_res_cache: Dict[int, List[Tuple[int, int]]] = {}
+        self._supported_fps_cache: Dict[int, List[int]] = {}
+        # AUTO_EXPOSURE "on" value the backend last accepted
+        self._ae_hint_value: Optional[float] = None
 
     # Helpers -----------------------------------------------------------
     def _cap(self):
         cap = self._get_cap()
         return cap if (cap is not None) else None
 
-    def _set_prop(self, prop_id: int, value: float) -> bool:
+    def _with_cap(self, fn: Callable[[object], object]) -> object:
+        """Run fn(cap) on the active capture; None if there is none."""
+        if self._use_cap is not None:
+            return self._use_cap(fn)
         cap = self._cap()
-        if cap is None or cv2 is None:
+        return fn(cap) if cap is not None else None
+
+    def _set_prop(self, prop_id: int, value: float) -> bool:
+        if cv2 is None:
             return False
         try:
-            ok = cap.set(prop_id, float(value))
-            return bool(ok)
+            return bool(self._with_cap(lambda cap: cap.set(prop_id, float(value))))
         except Exception:
             return False
 
     def _get_prop(self, prop_id: int) -> Optional[float]:
-        cap = self._cap()
-        if cap is None or cv2 is None:
+        if cv2 is None:
             return None
         try:
-            v = cap.get(prop_id)
-            return float(v)
+            v = self._with_cap(lambda cap: cap.get(prop_id))
+            return float(v) if v is not None else None
         except Exception:
             return None
 
@@ -66,6 +79,10 @@ class CameraController:
 
     def set_camera_index(self, idx: int) -> None:
         self.settings.set_camera_index(int(idx))
+        # A (re)opened device may report different capabilities
+        self._supported_res_cache.pop(int(idx), None)
+        self._supported_fps_cache.pop(int(idx), None)
+        self._ae_hint_value = None
         if self._change_index is not None:
             try:
                 self._change_index(int(idx))
@@ -77,9 +94,18 @@ class CameraController:
         self.settings.set_camera_auto_exposure(bool(on_off))
         if cv2 is None:
             return False
-        # OpenCV AUTO_EXPOSURE varies by backend. Try common values.
-        for val in (0.75, 1.0, 0.0, 0.25):  # try several hints
-            if self._set_prop(cv2.CAP_PROP_AUTO_EXPOSURE, float(val if on_off else 0.0)):
+        if not on_off:
+            # Same value for every hint; one attempt is enough
+            return self._set_prop(cv2.CAP_PROP_AUTO_EXPOSURE, 0.0)
+        # OpenCV AUTO_EXPOSURE varies by backend. Try the last accepted hint first.
+        hints = (0.75, 1.0, 0.0, 0.25)
+        if self._ae_hint_value is not None:
+            if self._set_prop(cv2.CAP_PROP_AUTO_EXPOSURE, self._ae_hint_value):
+                return True
+            hints = tuple(v for v in hints if v != self._ae_hint_value)
+        for val in hints:  # try several hints
+            if self._set_prop(cv2.CAP_PROP_AUTO_EXPOSURE, float(val)):
+                self._ae_hint_value = float(val)
                 return True
         return False
 
@@ -134,6 +160,12 @@ class CameraController:
         return self._set_prop(cv2.CAP_PROP_AUTO_WB, 1.0 if on_off else 0.0)
 
     # Query -------------------------------------------------------------
+    def _cam_key(self) -> int:
+        try:
+            return int(self.settings.camera_index())
+        except Exception:
+            return 0
+
     def get_supported_resolutions(self) -> List[Tuple[int, int]]:
         if cv2 is None:
             return self.RES_PRESETS
@@ -141,6 +173,19 @@ class CameraController:
         if cap is None:
             # unknown; report presets
             return self.RES_PRESETS
+        key = self._cam_key()
+        cached = self._supported_res_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        # One exclusive section, so no frame is grabbed mid-probe
+        supported = self._with_cap(self._probe_resolutions)
+        if supported is None:
+            return self.RES_PRESETS
+        result = supported or self.RES_PRESETS
+        self._supported_res_cache[key] = list(result)
+        return result
+
+    def _probe_resolutions(self, cap) -> List[Tuple[int, int]]:
         # Probe by attempting to set and verify, then restore
         try:
             prev_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -165,7 +210,7 @@ class CameraController:
                 cap.set(cv2.CAP_PROP_FRAME_HEIGHT, prev_h)
             except Exception:
                 pass
-        return supported or self.RES_PRESETS
+        return supported
 
     def get_supported_fps(self) -> List[int]:
         if cv2 is None:
@@ -173,12 +218,30 @@ class CameraController:
         cap = self._cap()
         if cap is None:
             return self.FPS_PRESETS
-        prev = self._get_prop(cv2.CAP_PROP_FPS)
+        key = self._cam_key()
+        cached = self._supported_fps_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        supported = self._with_cap(self._probe_fps)
+        if supported is None:
+            return self.FPS_PRESETS
+        result = supported or self.FPS_PRESETS
+        self._supported_fps_cache[key] = list(result)
+        return result
+
+    def _probe_fps(self, cap) -> List[int]:
+        try:
+            prev: Optional[float] = float(cap.get(cv2.CAP_PROP_FPS))
+        except Exception:
+            prev = None
         supported: List[int] = []
         for f in self.FPS_PRESETS:
             try:
-                if self._set_prop(cv2.CAP_PROP_FPS, float(f)):
-                    val = self._get_prop(cv2.CAP_PROP_FPS)
+                if cap.set(cv2.CAP_PROP_FPS, float(f)):
+                    try:
+                        val: Optional[float] = float(cap.get(cv2.CAP_PROP_FPS))
+                    except Exception:
+                        val = None
                     if val is None or abs(val - f) < 1.0:
                         supported.append(f)
             except Exception:
@@ -186,10 +249,10 @@ class CameraController:
         # restore
         if prev is not None:
             try:
-                self._set_prop(cv2.CAP_PROP_FPS, float(prev))
+                cap.set(cv2.CAP_PROP_FPS, float(prev))
             except Exception:
                 pass
-        return supported or self.FPS_PRESETS
+        return supported
 
     def get_current_settings(self) -> Dict[str, float | int | bool | Tuple[int, int]]:
         w, h = self.settings.camera_resolution()
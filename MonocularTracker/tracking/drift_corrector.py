@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Deque, Optional, Tuple
+from typing import Optional, Tuple
+
+from MonocularTracker.control.running_window import RunningWindow
 
 
 class DriftCorrector:
@@ -10,7 +11,9 @@ class DriftCorrector:
         self.window = max(1, int(window))
         self.threshold_ratio = float(threshold_ratio)
         self.learn_rate = float(learn_rate)
-        self._errs: Deque[Tuple[float, float]] = deque(maxlen=self.window)
+        # Rolling windows of recent (ex, ey) errors with running sums
+        self._ex = RunningWindow(self.window)
+        self._ey = RunningWindow(self.window)
         self._off = (0.0, 0.0)
 
     def correct(self, xy: Tuple[int, int]) -> Tuple[int, int]:
@@ -22,27 +25,24 @@ class DriftCorrector:
     def update(self, observed: Tuple[int, int], target: Tuple[int, int], screen: Tuple[int, int]) -> None:
         if not self.enabled:
             return
-        ex = float(target[0] - observed[0])
-        ey = float(target[1] - observed[1])
-        self._errs.append((ex, ey))
+        self._ex.push(target[0] - observed[0])
+        self._ey.push(target[1] - observed[1])
         mx, my = self._mean()
         if mx is None:
             return
-        mag = (mx * mx + my * my) ** 0.5
-        if mag > max(1.0, float(screen[0]) * self.threshold_ratio):
+        thr = max(1.0, float(screen[0]) * self.threshold_ratio)
+        if mx * mx + my * my > thr * thr:
             self._off = (self._off[0] + mx * self.learn_rate, self._off[1] + my * self.learn_rate)
 
     def offset(self) -> Tuple[float, float]:
         return self._off
 
     def reset(self) -> None:
-        self._errs.clear()
+        self._ex.reset()
+        self._ey.reset()
         self._off = (0.0, 0.0)
 
     def _mean(self) -> Tuple[Optional[float], Optional[float]]:
-        if not self._errs:
+        if not len(self._ex):
             return (None, None)
-        sx = sum(e[0] for e in self._errs)
-        sy = sum(e[1] for e in self._errs)
-        n = float(len(self._errs))
-        return (sx / n, sy / n)
+        return (self._ex.mean(), self._ey.mean())
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from collections import deque
 from typing import List, Optional, Tuple
 
 try:
@@ -13,14 +12,45 @@ except Exception:  # pragma: no cover
     np = None  # type: ignore
     mp = None  # type: ignore
 
+from MonocularTracker.control.mono_window import MonoWindow
+
 
 RIGHT_IRIS_IDX = [474, 475, 476, 477]
 RIGHT_EYE_LANDMARKS = [33, 133, 159, 145]
 LEFT_IRIS_IDX = [469, 470, 471, 472]
 LEFT_EYE_LANDMARKS = [263, 362, 386, 374]
-
-
-@dataclass
+# Landmarks read each frame, shared by all parsers: right iris+lids, then left
+_EYE_IDX = tuple(RIGHT_IRIS_IDX + RIGHT_EYE_LANDMARKS + LEFT_IRIS_IDX + LEFT_EYE_LANDMARKS)
+# Row/column step of the pixel grid sampled for duplicate-frame signatures
+_SIG_STEP = (37, 53)
+
+
+def _normalize_eye(cx: float, cy: float, x_outer: float, x_inner: float, y_up: float, y_low: float, last: Optional[Tuple[float, float]]) -> Optional[Tuple[float, float]]:
+    """Iris center -> (nx, ny) in [0, 1] within the eye, or None for a closed eye.
+
+    Normalizes by the corner and eyelid pair distances (more stable than a
+    loose bbox), then limits the per-frame change against ``last`` to 0.12 to
+    suppress spikes.
+    """
+    eye_w = abs(x_inner - x_outer)
+    if eye_w < 1.0:
+        eye_w = 1.0
+    eye_h = abs(y_low - y_up)
+    if eye_h < 1.0:
+        eye_h = 1.0
+    # Blink/closed-eye rejection
+    if eye_h < 0.15 * eye_w:
+        return None
+    nx = min(1.0, max(0.0, (cx - x_outer) / eye_w))
+    ny = min(1.0, max(0.0, (cy - y_up) / eye_h))
+    if last is not None:
+        lx, ly = last
+        nx = lx + min(0.12, max(-0.12, nx - lx))
+        ny = ly + min(0.12, max(-0.12, ny - ly))
+    return (nx, ny)
+
+
+@dataclass(slots=True)
 class Features:
     iris_center: Tuple[float, float]
     eyelid_box: Tuple[int, int, int, int]
@@ -31,86 +61,65 @@ class Features:
 
 
 class GazeParser:
-    def __init__(self, eye_mode: str = "auto") -> None:
+    def __init__(self, eye_mode: str = "auto", max_side: int = 640) -> None:
         if mp is None:
             raise RuntimeError("mediapipe not installed.")
         self.eye_mode = eye_mode if eye_mode in ("auto", "right", "left") else "auto"
+        # Frames larger than this (longest side, px) are downscaled before
+        # FaceMesh; landmarks are normalized, so callers still see full-res coords.
+        # 0 disables.
+        self.max_side = max(0, int(max_side))
         self._mesh = mp.solutions.face_mesh.FaceMesh(
             max_num_faces=1, refine_landmarks=True, min_detection_confidence=0.5, min_tracking_confidence=0.5
         )
         # For auto mode, track recent movement per eye to pick the stronger signal
-        self._hist_right = deque(maxlen=30)
-        self._hist_left = deque(maxlen=30)
-        # Disable median smoothing of iris centers
-        self._iris_hist_right = deque(maxlen=1)
-        self._iris_hist_left = deque(maxlen=1)
+        # (x, y) windows per eye, so each frame's range query is O(1)
+        self._hist_right = (MonoWindow(30), MonoWindow(30))
+        self._hist_left = (MonoWindow(30), MonoWindow(30))
+        # Downscale and RGB conversion targets, reused across frames of the same shape
+        self._small_buf = None
+        self._rgb_buf = None
+        # Signature and result of the last processed frame (see _frame_sig)
+        self._last_sig: tuple = ()
+        self._last_feats: Optional[Features] = None
         # Last normalized coords for soft delta-clamp per eye
         self._last_norm_right: Optional[Tuple[float, float]] = None
         self._last_norm_left: Optional[Tuple[float, float]] = None
 
     def set_mode(self, mode: str) -> None:
         self.eye_mode = mode if mode in ("auto", "right", "left") else "auto"
+        self.invalidate()
 
-    def _extract_eye(self, pts, iris_idx, lid_idx, w: int, h: int, tag: str) -> Optional[Features]:
-        iris = self._points(pts, iris_idx, w, h)
-        if len(iris) < 2:
-            return None
-        # Raw iris center (mean of iris points)
-        cx = sum(p[0] for p in iris) / len(iris)
-        cy = sum(p[1] for p in iris) / len(iris)
+    def invalidate(self) -> None:
+        """Forget the cached result, e.g. after writing into a frame buffer in place."""
+        self._last_sig = ()
+        self._last_feats = None
 
-        # Use specific landmarks for robust normalization and blink detection
-        if tag == "right":
-            idx_outer, idx_inner, idx_up, idx_low = 33, 133, 159, 145
-            iris_hist = self._iris_hist_right
-        else:
-            idx_outer, idx_inner, idx_up, idx_low = 263, 362, 386, 374
-            iris_hist = self._iris_hist_left
-        # Fetch points
-        def _pt(i):
-            try:
-                p = pts[i]
-                return (p.x * w, p.y * h)
-            except Exception:
-                return None
-        p_outer = _pt(idx_outer)
-        p_inner = _pt(idx_inner)
-        p_up = _pt(idx_up)
-        p_low = _pt(idx_low)
-        if None in (p_outer, p_inner, p_up, p_low):
-            return None
-        x_outer, y_outer = p_outer  # type: ignore[misc]
-        x_inner, y_inner = p_inner  # type: ignore[misc]
-        x_up, y_up = p_up  # type: ignore[misc]
-        x_low, y_low = p_low  # type: ignore[misc]
-        eye_w = max(1.0, abs(x_inner - x_outer))
-        eye_h = max(1.0, abs(y_low - y_up))
-        # Blink/closed-eye rejection
-        if (eye_h / eye_w) < 0.15:
-            return None
-        # No median smoothing; use raw iris center
-        cx_s, cy_s = float(cx), float(cy)
-        # Normalize using corner/eyelid pair distances (more stable than loose bbox)
-        nx = (cx_s - x_outer) / eye_w
-        ny = (cy_s - y_up) / eye_h
-        nx = float(max(0.0, min(1.0, nx)))
-        ny = float(max(0.0, min(1.0, ny)))
-        # Soft clamp per-frame delta to suppress spikes
+    @staticmethod
+    def _frame_sig(frame) -> tuple:
+        # Buffer address and shape plus a sparse pixel grid: a few hundred
+        # pixels, and a new capture differs in them (sensor noise at least)
         try:
-            last = self._last_norm_right if tag == "right" else self._last_norm_left
-            if last is not None:
-                max_d = 0.12  # max change per frame in normalized units
-                dx = max(-max_d, min(max_d, nx - last[0]))
-                dy = max(-max_d, min(max_d, ny - last[1]))
-                nx = float(last[0] + dx)
-                ny = float(last[1] + dy)
+            sample = frame[::_SIG_STEP[0], ::_SIG_STEP[1]].tobytes()
         except Exception:
-            pass
-        # update last
+            return ()
+        return (frame.ctypes.data, frame.shape, sample)
+
+    def _extract_eye(self, xy, w: int, h: int, tag: str) -> Optional[Features]:
+        """``xy`` is a (8, 2) pixel array: 4 iris points, then outer/inner/upper/lower lid."""
+        iris = xy[:4]
+        # Raw iris center (mean of iris points), as Python floats for the scalar math below
+        cx, cy = iris.mean(axis=0).tolist()
+        (x_outer, y_outer), (x_inner, y_inner), (x_up, y_up), (x_low, y_low) = xy[4:].tolist()
+        last = self._last_norm_right if tag == "right" else self._last_norm_left
+        norm = _normalize_eye(cx, cy, x_outer, x_inner, y_up, y_low, last)
+        if norm is None:
+            return None
+        nx, ny = norm
         if tag == "right":
-            self._last_norm_right = (nx, ny)
+            self._last_norm_right = norm
         else:
-            self._last_norm_left = (nx, ny)
+            self._last_norm_left = norm
 
         # Eyelid box for overlay (slightly expanded)
         m = 2
@@ -118,30 +127,68 @@ class GazeParser:
         x2 = min(w - 1, int(max(x_outer, x_inner)) + m)
         y1 = max(0, int(min(y_up, y_low)) - m)
         y2 = min(h - 1, int(max(y_up, y_low)) + m)
-        lids = [(x_outer, y_outer), (x_inner, y_inner), (x_up, y_up), (x_low, y_low)]
-        landmarks = lids + iris
-        return Features(iris_center=(cx_s, cy_s), eyelid_box=(x1, y1, x2, y2), nx=nx, ny=ny, landmarks=landmarks, eye=tag)
+        landmarks = list(map(tuple, xy[4:].tolist() + iris.tolist()))
+        return Features(iris_center=(cx, cy), eyelid_box=(x1, y1, x2, y2), nx=nx, ny=ny, landmarks=landmarks, eye=tag)
 
-    def process(self, frame) -> Optional[Features]:
+    def process(self, frame, check_repeat: bool = True) -> Optional[Features]:
+        """Detect features in a BGR frame.
+
+        Callers that cannot tell a repeated frame from a new one get the last
+        result back when the pixel signature matches. Callers that know (the
+        Pipeline tracks capture sequence numbers) pass ``check_repeat=False``
+        for a frame known to be new.
+        """
         if cv2 is None or frame is None:
             return None
+        if not check_repeat:
+            self._last_sig = ()
+            self._last_feats = None
+            return self._process(frame)
+        sig = self._frame_sig(frame)
+        if sig and sig == self._last_sig:
+            # Same frame again (paused or stalled source): skip FaceMesh and
+            # leave the per-eye history untouched
+            return self._last_feats
+        feats = self._process(frame)
+        self._last_sig = sig
+        self._last_feats = feats
+        return feats
+
+    def _process(self, frame) -> Optional[Features]:
         h, w = frame.shape[:2]
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = self._mesh.process(rgb)
+        src = frame
+        side = max(h, w)
+        if 0 < self.max_side < side:
+            s = self.max_side / side
+            shape = (max(1, int(h * s)), max(1, int(w * s))) + frame.shape[2:]
+            small = self._small_buf
+            if small is None or small.shape != shape or small.dtype != frame.dtype:
+                small = self._small_buf = np.empty(shape, dtype=frame.dtype)
+            cv2.resize(frame, (shape[1], shape[0]), dst=small, interpolation=cv2.INTER_AREA)
+            src = small
+        buf = self._rgb_buf
+        if buf is None or buf.shape != src.shape or buf.dtype != src.dtype:
+            buf = self._rgb_buf = np.empty_like(src)
+        cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=buf)
+        res = self._mesh.process(buf)
         if not res.multi_face_landmarks:
             return None
         face = res.multi_face_landmarks[0]
-        pts = face.landmark
+        xy = self._points(face.landmark, _EYE_IDX, w, h)
+        if xy is None:
+            return None
 
         # Extract requested eyes
-        fr = self._extract_eye(pts, RIGHT_IRIS_IDX, RIGHT_EYE_LANDMARKS, w, h, "right")
-        fl = self._extract_eye(pts, LEFT_IRIS_IDX, LEFT_EYE_LANDMARKS, w, h, "left")
+        fr = self._extract_eye(xy[:8], w, h, "right")
+        fl = self._extract_eye(xy[8:], w, h, "left")
 
         # Record movement history (auto mode)
         if fr is not None:
-            self._hist_right.append((fr.nx, fr.ny))
+            self._hist_right[0].push(fr.nx)
+            self._hist_right[1].push(fr.ny)
         if fl is not None:
-            self._hist_left.append((fl.nx, fl.ny))
+            self._hist_left[0].push(fl.nx)
+            self._hist_left[1].push(fl.ny)
 
         mode = self.eye_mode
         if mode == "right":
@@ -149,30 +196,30 @@ class GazeParser:
         if mode == "left":
             return fl
         # auto: choose by movement range, fallback to larger eyelid area
-        def score(hist, f: Optional[Features]):
-            if f is None:
-                return -1.0
-            if len(hist) >= 10:
-                xs = [p[0] for p in hist]
-                ys = [p[1] for p in hist]
-                return (max(xs) - min(xs)) + (max(ys) - min(ys))
-            # fallback: area proxy
-            x1, y1, x2, y2 = f.eyelid_box
-            return float((x2 - x1) * (y2 - y1)) / 10000.0
-        s_r = score(self._hist_right, fr)
-        s_l = score(self._hist_left, fl)
+        s_r = self._eye_score(self._hist_right, fr)
+        s_l = self._eye_score(self._hist_left, fl)
         if s_r >= s_l:
             return fr if fr is not None else fl
         else:
             return fl if fl is not None else fr
 
     @staticmethod
-    def _points(pts, idxs: List[int], w: int, h: int) -> List[Tuple[float, float]]:
-        out: List[Tuple[float, float]] = []
-        for i in idxs:
-            try:
-                p = pts[i]
-            except Exception:
-                continue
-            out.append((p.x * w, p.y * h))
-        return out
+    def _eye_score(hist, f: Optional[Features]) -> float:
+        if f is None:
+            return -1.0
+        hx, hy = hist
+        if len(hx) >= 10:
+            return hx.range() + hy.range()
+        # fallback: area proxy
+        x1, y1, x2, y2 = f.eyelid_box
+        return float((x2 - x1) * (y2 - y1)) / 10000.0
+
+    @staticmethod
+    def _points(pts, idxs, w: int, h: int):
+        """Gather the given landmarks into one (N, 2) pixel array, or None if any is missing."""
+        try:
+            xy = np.array([(pts[i].x, pts[i].y) for i in idxs], dtype=np.float64)
+        except IndexError:
+            return None
+        xy *= (w, h)
+        return xy
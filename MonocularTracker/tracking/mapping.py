@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import Optional, Tuple
 
 from .calibration import Calibrator
@@ -7,9 +8,16 @@ from .drift_corrector import DriftCorrector
 from .smoothing import ButterworthLowPass, TrendPredictor
 
 
+def _clamp(v, hi):
+    """Clamp to [0, hi] with plain comparisons (no min/max calls)."""
+    return 0 if v < 0 else (hi if v > hi else v)
+
+
 class Mapping:
-    def __init__(self, alpha: float = 0.25, drift_enabled: bool = True, drift_lr: float = 0.01, sample_rate_hz: float = 30.0) -> None:
-        self.calib = Calibrator()
+    __slots__ = ("calib", "lp", "pred", "drift", "_calibrating", "_last_out")
+
+    def __init__(self, alpha: float = 0.25, drift_enabled: bool = True, drift_lr: float = 0.01, sample_rate_hz: float = 30.0, calib_method: str = "poly2") -> None:
+        self.calib = Calibrator(method=calib_method)
         # Use Butterworth low-pass only for smoothing; constants set in filter
         self.lp = ButterworthLowPass(sample_rate_hz=sample_rate_hz)
         self.pred = TrendPredictor(window=8, lookahead=0.15)
@@ -38,6 +46,9 @@ class Mapping:
     def predict(self, feature: Tuple[float, float]) -> Tuple[int, int]:
         return self.calib.predict(feature)
 
+    def predict_batch(self, features):
+        return self.calib.predict_batch(features)
+
     def map_only(self, feature: Tuple[float, float]) -> Tuple[int, int]:
         """Direct mapping without drift correction, trend prediction, or smoothing."""
         return self.calib.predict(feature)
@@ -46,13 +57,13 @@ class Mapping:
         # raw mapping
         x, y = self.predict(feature)
         # Validate raw output
-        import math
         if not (isinstance(x, (int, float)) and isinstance(y, (int, float)) and math.isfinite(x) and math.isfinite(y)):
             return self._last_out if self._last_out is not None else (0, 0)
         # clamp immediately to screen bounds BEFORE smoothing/prediction
-        w, h = screen_size
-        x = int(max(0, min(w - 1, int(round(x)))))
-        y = int(max(0, min(h - 1, int(round(y)))))
+        w1 = screen_size[0] - 1
+        h1 = screen_size[1] - 1
+        x = _clamp(int(round(x)), w1)
+        y = _clamp(int(round(y)), h1)
         # gentle drift correction (disabled during calibration)
         if self._calibrating:
             xy_corr = (x, y)
@@ -64,18 +75,17 @@ class Mapping:
         if not (math.isfinite(px) and math.isfinite(py)):
             return self._last_out if self._last_out is not None else (x, y)
         # Clamp again pre-smoothing to ensure bounds
-        px = int(max(0, min(w - 1, int(round(px)))))
-        py = int(max(0, min(h - 1, int(round(py)))))
+        px = _clamp(int(round(px)), w1)
+        py = _clamp(int(round(py)), h1)
         # smoothing (Butterworth low-pass only)
         sx, sy = self.lp.apply((px, py))
         # tiny deadzone to suppress micro-jitter
-        if self._last_out is not None:
-            dx = sx - self._last_out[0]
-            dy = sy - self._last_out[1]
-            if (dx * dx + dy * dy) ** 0.5 < 1.5:
-                sx, sy = self._last_out
-        # clamp to screen
-        sx = max(0, min(w - 1, sx))
-        sy = max(0, min(h - 1, sy))
-        self._last_out = (sx, sy)
-        return sx, sy
+        last = self._last_out
+        if last is not None:
+            dx = sx - last[0]
+            dy = sy - last[1]
+            if dx * dx + dy * dy < 2.25:  # |d| < 1.5 px
+                sx, sy = last
+        # clamp to screen (the screen may have shrunk since `last`)
+        out = self._last_out = (_clamp(sx, w1), _clamp(sy, h1))
+        return out
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import isfinite as _isfinite
 from typing import Optional, Tuple
 import time
 
@@ -9,48 +10,96 @@ try:
 except Exception:  # pragma: no cover
     cv2 = None
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 from MonocularTracker.camera import Camera
 from .gaze_parser import GazeParser
 from .mapping import Mapping
 from .smoothing import ButterworthLowPass
-try:
-    from MonocularTracker.ai.openvino_gaze import OpenVinoGaze  # type: ignore
-except Exception:
-    OpenVinoGaze = None  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameResult:
     frame: Optional[object]
     face_ok: bool
     eye_ok: bool
     predicted_xy: Optional[Tuple[int, int]]
     features: Optional[object]
+    # Identifies the captured frame; repeats when the same frame is returned again
+    frame_id: int = 0
 
 
 class Pipeline:
-    def __init__(self, camera_index: int, screen_size: Tuple[int, int], alpha: float, drift_enabled: bool, drift_lr: float, eye_mode: str = "auto", gaze_engine: str = "landmark", model_dir: str | None = None) -> None:
+    __slots__ = (
+        "cam", "parser", "map", "_norm_lp", "screen_size", "running",
+        "_last_seq", "dropped", "_next_deadline", "_results", "_res_i",
+        "_gaze_engine", "_model_dir", "_ov", "_ov_tried", "_feats_key", "_last_feats",
+    )
+
+    def __init__(self, camera_index: int, screen_size: Tuple[int, int], alpha: float, drift_enabled: bool, drift_lr: float, eye_mode: str = "auto", gaze_engine: str = "landmark", model_dir: str | None = None, calib_method: str = "poly2") -> None:
         self.cam = Camera(index=camera_index, width=1280, height=720, target_fps=30)
         self.parser = GazeParser(eye_mode=eye_mode)
         # Derive sampling rate for smoothing from camera FPS
         sr_hz = float(getattr(self.cam, "target_fps", 30))
-        self.map = Mapping(alpha=alpha, drift_enabled=drift_enabled, drift_lr=drift_lr, sample_rate_hz=sr_hz)
+        self.map = Mapping(alpha=alpha, drift_enabled=drift_enabled, drift_lr=drift_lr, sample_rate_hz=sr_hz, calib_method=calib_method)
         # Butterworth smoother for normalized coords (pre-mapping)
         self._norm_lp = ButterworthLowPass(sample_rate_hz=sr_hz)
         self.screen_size = screen_size
         self.running = False
+        # Drain-to-latest bookkeeping: sequence of the last frame handed out and
+        # how many captured frames were superseded before being processed
+        self._last_seq = 0
+        self.dropped = 0
+        # Cadence anchor for the synchronous (no capture thread) path; see _pace
+        self._next_deadline = time.perf_counter()
+        # process() fills these two in turn instead of allocating a result per
+        # frame. A result stays valid until the next-but-one process() call,
+        # which covers the one in flight plus the one the consumer holds.
+        # Use dataclasses.replace() to keep one longer.
+        self._results = (
+            FrameResult(None, False, False, None, None),
+            FrameResult(None, False, False, None, None),
+        )
+        self._res_i = 0
+        # (frame_id, eye mode) of _last_feats: a repeated capture sequence
+        # number reuses them instead of running detection again
+        self._feats_key: Optional[tuple] = None
+        self._last_feats = None
         self._gaze_engine = str(gaze_engine or "landmark")
-        self._ov: OpenVinoGaze | None = None  # type: ignore[assignment]
-        if OpenVinoGaze is not None and self._gaze_engine in ("openvino", "hybrid"):
+        self._model_dir = model_dir
+        # OpenVINO gaze model, loaded on first use (see _get_ov)
+        self._ov = None
+        self._ov_tried = False
+
+    def _get_ov(self):
+        """The OpenVINO gaze adapter for 'openvino'/'hybrid' engines, or None.
+
+        Importing the runtime and compiling the model take hundreds of ms, so
+        this happens on first use rather than at construction; a failed load
+        is not retried.
+        """
+        if not self._ov_tried and self._gaze_engine in ("openvino", "hybrid"):
+            self._ov_tried = True
             try:
-                self._ov = OpenVinoGaze(model_dir=model_dir)
+                from MonocularTracker.ai.openvino_gaze import OpenVinoGaze  # type: ignore
+                self._ov = OpenVinoGaze(model_dir=self._model_dir)
             except Exception:
                 self._ov = None
+        return self._ov
 
     def start(self) -> None:
         if self.running:
             return
         self.cam.open()
+        self.cam.start_capture()
+        self._last_seq = 0
+        # Sequence numbers restart with the capture thread
+        self._feats_key = None
+        self._last_feats = None
+        self._next_deadline = time.perf_counter()
         self.running = True
 
     def stop(self) -> None:
@@ -62,51 +111,101 @@ class Pipeline:
     def frame(self) -> Optional[object]:
         if not self.running:
             return None
-        return self.cam.read()
+        if not self.cam.capturing:
+            fr = self.cam.read()
+            if fr is not None:
+                self._last_seq += 1
+            return fr
+        # The capture thread keeps only the newest frame, so whatever we take
+        # here is at most one frame old; count the ones it overwrote. If it has
+        # nothing new yet, block (this runs on the worker thread) until it
+        # does, for at most two frame periods (covers delivery jitter)
+        latest = self.cam.wait_latest(self._last_seq, 2.0 / float(self.cam.target_fps))
+        if latest is None:
+            return None
+        seq, fr = latest
+        if self._last_seq and seq > self._last_seq + 1:
+            self.dropped += seq - self._last_seq - 1
+        self._last_seq = seq
+        return fr
+
+    def frame_ready(self) -> bool:
+        """True unless the capture thread has nothing newer than the last frame."""
+        if not (self.running and self.cam.capturing):
+            return True
+        latest = self.cam.read_latest()
+        return latest is not None and latest[0] != self._last_seq
 
     def process(self) -> FrameResult:
-        # Enforce fixed FPS pacing around processing
-        frame_interval = 1.0 / float(getattr(self.cam, "target_fps", 30))
-        start_t = time.perf_counter()
+        # With the capture thread running the device paces frames itself, so
+        # never sleep on the caller; the latest frame is already in memory
+        if self.cam.capturing:
+            return self._process()
+        try:
+            return self._process()
+        finally:
+            self._pace()
+
+    def _pace(self) -> None:
+        """Hold a fixed cadence against a monotonic deadline, whichever path process() took."""
+        interval = 1.0 / float(getattr(self.cam, "target_fps", 30))
+        now = time.perf_counter()
+        deadline = self._next_deadline + interval
+        delay = deadline - now
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -interval:
+            # Fell more than a frame behind (stall); restart the cadence
+            # instead of bursting to catch up
+            deadline = now
+        self._next_deadline = deadline
+
+    def _result(self, frame, face_ok: bool, eye_ok: bool, predicted_xy, features, frame_id: int = 0) -> FrameResult:
+        i = self._res_i ^ 1
+        self._res_i = i
+        r = self._results[i]
+        r.frame = frame
+        r.face_ok = face_ok
+        r.eye_ok = eye_ok
+        r.predicted_xy = predicted_xy
+        r.features = features
+        r.frame_id = frame_id
+        return r
+
+    def _process(self) -> FrameResult:
         fr = self.frame()
         if fr is None:
-            # If frame read failed, wait remaining interval to maintain cadence
-            elapsed = time.perf_counter() - start_t
-            remaining = frame_interval - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
-            return FrameResult(frame=None, face_ok=False, eye_ok=False, predicted_xy=None, features=None)
-        feats = self.parser.process(fr)
+            return self._result(None, False, False, None, None)
+        fid = self._last_seq
+        # Hand every consumer one C-contiguous BGR buffer (no-op for camera
+        # frames) so the video widget can wrap it without copying
+        if np is not None:
+            fr = np.ascontiguousarray(fr)
+        key = (fid, self.parser.eye_mode)
+        if key == self._feats_key:
+            # Same capture (no newer frame arrived in time): skip detection
+            feats = self._last_feats
+        else:
+            feats = self.parser.process(fr, check_repeat=False)
+            self._feats_key = key
+            self._last_feats = feats
         if feats is None:
-            elapsed = time.perf_counter() - start_t
-            remaining = frame_interval - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
-            return FrameResult(frame=fr, face_ok=False, eye_ok=False, predicted_xy=None, features=None)
+            return self._result(fr, False, False, None, None, fid)
         # Strict order without branching:
         # 1) Capture frame (done)
         # 2) Detect face/eyes (feats)
         # 3) Validate detection confidence
-        nx = float(feats.nx)
-        ny = float(feats.ny)
-        import math
-        if not (math.isfinite(nx) and math.isfinite(ny)):
-            elapsed = time.perf_counter() - start_t
-            remaining = frame_interval - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
-            return FrameResult(frame=fr, face_ok=True, eye_ok=False, predicted_xy=None, features=feats)
+        # GazeParser already yields Python floats
+        nx = feats.nx
+        ny = feats.ny
+        if not (_isfinite(nx) and _isfinite(ny)):
+            return self._result(fr, True, False, None, feats, fid)
         # 4) Apply Butterworth smoothing (normalized coords)
         snx, sny = self._norm_lp.apply_float((nx, ny))
         # Clamp normalized to [0,1]
-        snx = max(0.0, min(1.0, float(snx)))
-        sny = max(0.0, min(1.0, float(sny)))
+        snx = max(0.0, min(1.0, snx))
+        sny = max(0.0, min(1.0, sny))
         # 5) Map to screen coordinates (direct mapping only)
         x, y = self.map.map_only((snx, sny))
         # 6) Output cursor position
-        # Pacing: if processing finished early, sleep remaining; if exceeded budget, skip sleep (drop cadence)
-        elapsed = time.perf_counter() - start_t
-        remaining = frame_interval - elapsed
-        if remaining > 0:
-            time.sleep(remaining)
-        return FrameResult(frame=fr, face_ok=True, eye_ok=True, predicted_xy=(x, y), features=feats)
+        return self._result(fr, True, True, (x, y), feats, fid)
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import math
+from functools import lru_cache
 from typing import Optional, Tuple
 
-
 # Fixed filter constants (not user-editable)
 CUTOFF_HZ = 6.0
 ORDER = 2  # biquad
 
+
+@lru_cache(maxsize=16)
+def _coeffs(sr: float, fc: float) -> Tuple[float, float, float, float, float]:
+    """(b0, b1, b2, a1, a2) of a Butterworth low-pass biquad (Q=1/sqrt(2)), memoized per rate."""
+    # Butterworth 2nd-order low-pass (RBJ cookbook form)
+    # https://webaudio.github.io/Audio-EQ-Cookbook/audio-eq-cookbook.html
+    Q = 1.0 / math.sqrt(2.0)
+    K = math.tan(math.pi * fc / sr)
+    norm = 1.0 / (1.0 + K / Q + K * K)
+    b0 = K * K * norm
+    b1 = 2.0 * b0
+    b2 = b0
+    a1 = 2.0 * (K * K - 1.0) * norm
+    a2 = (1.0 - K / Q + K * K) * norm
+    return b0, b1, b2, a1, a2
+
+
 class ButterworthLowPass:
     """Second-order Butterworth low-pass filter for 2D points.
 
@@ -17,64 +35,43 @@ class ButterworthLowPass:
     The filter uses the bilinear transform to compute biquad coefficients.
     """
 
+    __slots__ = (
+        "_b0", "_b1", "_b2", "_a1", "_a2", "_primed",
+        "_x1x", "_x1y", "_x2x", "_x2y", "_y1x", "_y1y", "_y2x", "_y2y",
+    )
+
     def __init__(self, sample_rate_hz: float = 30.0) -> None:
         sr = max(1.0, float(sample_rate_hz))
         fc = max(0.5, min(sr / 2.0 - 0.001, float(CUTOFF_HZ)))
-        # Pre-warp and compute biquad coefficients for Butterworth (Q=1/sqrt(2))
-        import math
-
-        omega = 2.0 * math.pi * fc / sr
-        tan_ = math.tan(omega)
-        # Normalize for bilinear transform
-        c = 1.0 / tan_
-        # Butterworth 2nd-order low-pass (RBJ cookbook form)
-        # https://webaudio.github.io/Audio-EQ-Cookbook/audio-eq-cookbook.html
-        Q = 1.0 / math.sqrt(2.0)
-        K = math.tan(math.pi * fc / sr)
-        norm = 1.0 / (1.0 + K / Q + K * K)
-        b0 = K * K * norm
-        b1 = 2.0 * b0
-        b2 = b0
-        a1 = 2.0 * (K * K - 1.0) * norm
-        a2 = (1.0 - K / Q + K * K) * norm
-
-        self._b0 = b0
-        self._b1 = b1
-        self._b2 = b2
-        self._a1 = a1
-        self._a2 = a2
-        self._x1: Optional[Tuple[float, float]] = None
-        self._x2: Optional[Tuple[float, float]] = None
-        self._y1: Optional[Tuple[float, float]] = None
-        self._y2: Optional[Tuple[float, float]] = None
+        self._b0, self._b1, self._b2, self._a1, self._a2 = _coeffs(sr, fc)
+        # Per-axis state as flat floats: inputs x[n-1], x[n-2], outputs y[n-1], y[n-2]
+        self._primed = False
+        self._x1x = self._x1y = self._x2x = self._x2y = 0.0
+        self._y1x = self._y1y = self._y2x = self._y2y = 0.0
 
     def reset(self) -> None:
-        self._x1 = None
-        self._x2 = None
-        self._y1 = None
-        self._y2 = None
+        self._primed = False
 
-    def apply(self, xy: Tuple[int, int]) -> Tuple[int, int]:
-        x0 = float(xy[0]); y0 = float(xy[1])
-        if self._x1 is None:
+    def _step(self, x0: float, y0: float) -> Tuple[float, float]:
+        if not self._primed:
             # Initialize with first sample
-            self._x1 = (x0, y0)
-            self._x2 = (x0, y0)
-            self._y1 = (x0, y0)
-            self._y2 = (x0, y0)
-            return int(round(x0)), int(round(y0))
-        assert self._x2 is not None and self._y1 is not None and self._y2 is not None
-        x1, y1 = self._x1
-        x2, y2 = self._x2
-        yo1, yo2 = self._y1, self._y2
+            self._x1x = self._x2x = self._y1x = self._y2x = x0
+            self._x1y = self._x2y = self._y1y = self._y2y = y0
+            self._primed = True
+            return x0, y0
+        b0 = self._b0; b1 = self._b1; b2 = self._b2; a1 = self._a1; a2 = self._a2
         # Biquad difference equation per axis
-        ox = self._b0 * x0 + self._b1 * x1 + self._b2 * x2 - self._a1 * yo1[0] - self._a2 * yo2[0]
-        oy = self._b0 * y0 + self._b1 * y1 + self._b2 * y2 - self._a1 * yo1[1] - self._a2 * yo2[1]
+        ox = b0 * x0 + b1 * self._x1x + b2 * self._x2x - a1 * self._y1x - a2 * self._y2x
+        oy = b0 * y0 + b1 * self._x1y + b2 * self._x2y - a1 * self._y1y - a2 * self._y2y
         # Update state
-        self._x2 = self._x1
-        self._x1 = (x0, y0)
-        self._y2 = self._y1
-        self._y1 = (ox, oy)
+        self._x2x = self._x1x; self._x2y = self._x1y
+        self._x1x = x0; self._x1y = y0
+        self._y2x = self._y1x; self._y2y = self._y1y
+        self._y1x = ox; self._y1y = oy
+        return ox, oy
+
+    def apply(self, xy: Tuple[int, int]) -> Tuple[int, int]:
+        ox, oy = self._step(float(xy[0]), float(xy[1]))
         return int(round(ox)), int(round(oy))
 
     def apply_float(self, xy: Tuple[float, float]) -> Tuple[float, float]:
@@ -82,24 +79,7 @@ class ButterworthLowPass:
 
         Useful for smoothing normalized coordinates prior to mapping.
         """
-        x0 = float(xy[0]); y0 = float(xy[1])
-        if self._x1 is None:
-            self._x1 = (x0, y0)
-            self._x2 = (x0, y0)
-            self._y1 = (x0, y0)
-            self._y2 = (x0, y0)
-            return (x0, y0)
-        assert self._x2 is not None and self._y1 is not None and self._y2 is not None
-        x1, y1 = self._x1
-        x2, y2 = self._x2
-        yo1, yo2 = self._y1, self._y2
-        ox = self._b0 * x0 + self._b1 * x1 + self._b2 * x2 - self._a1 * yo1[0] - self._a2 * yo2[0]
-        oy = self._b0 * y0 + self._b1 * y1 + self._b2 * y2 - self._a1 * yo1[1] - self._a2 * yo2[1]
-        self._x2 = self._x1
-        self._x1 = (x0, y0)
-        self._y2 = self._y1
-        self._y1 = (ox, oy)
-        return (ox, oy)
+        return self._step(float(xy[0]), float(xy[1]))
 
 
 class TrendPredictor:
@@ -110,33 +90,52 @@ class TrendPredictor:
     (low jitter), returns the input unchanged.
     """
 
+    __slots__ = ("_adx", "_ady", "_sdx", "_sdy", "_last", "lookahead")
+
     def __init__(self, window: int = 8, lookahead: float = 0.15) -> None:
         from collections import deque
 
-        self._hist = deque(maxlen=max(4, int(window)))
+        # Absolute successive diffs of the last `window` points, with running
+        # sums; inputs are whole pixels, so the sums stay exact
+        n = max(4, int(window)) - 1
+        self._adx = deque(maxlen=n)
+        self._ady = deque(maxlen=n)
+        self._sdx = 0.0
+        self._sdy = 0.0
+        self._last: Optional[Tuple[float, float]] = None
         self.lookahead = float(lookahead)
 
     def reset(self) -> None:
-        try:
-            self._hist.clear()
-        except Exception:
-            pass
+        self._adx.clear()
+        self._ady.clear()
+        self._sdx = 0.0
+        self._sdy = 0.0
+        self._last = None
 
     def update(self, x: int, y: int) -> Tuple[int, int]:
         xi = int(x); yi = int(y)
-        self._hist.append((float(xi), float(yi)))
-        if len(self._hist) < 4:
+        fx = float(xi); fy = float(yi)
+        last = self._last
+        self._last = (fx, fy)
+        if last is None:
+            return (xi, yi)
+        vx = fx - last[0]
+        vy = fy - last[1]
+        adx, ady = self._adx, self._ady
+        if len(adx) == adx.maxlen:
+            self._sdx -= adx[0]
+            self._sdy -= ady[0]
+        adx.append(abs(vx))
+        ady.append(abs(vy))
+        self._sdx += abs(vx)
+        self._sdy += abs(vy)
+        n = len(adx)
+        if n < 3:  # fewer than 4 points
             return (xi, yi)
-        xs = [p[0] for p in self._hist]
-        ys = [p[1] for p in self._hist]
-        vx = xs[-1] - xs[-2]
-        vy = ys[-1] - ys[-2]
         # Simple jitter metric: mean abs successive diff
-        mx = sum(abs(xs[i] - xs[i - 1]) for i in range(1, len(xs))) / (len(xs) - 1)
-        my = sum(abs(ys[i] - ys[i - 1]) for i in range(1, len(ys))) / (len(ys) - 1)
-        jitter = 0.5 * (mx + my)
+        jitter = 0.5 * (self._sdx / n + self._sdy / n)
         if jitter < 1.5:  # px threshold under which we avoid projecting
             return (xi, yi)
-        px = float(xi) + self.lookahead * vx
-        py = float(yi) + self.lookahead * vy
+        px = fx + self.lookahead * vx
+        py = fy + self.lookahead * vy
         return (int(round(px)), int(round(py)))
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+import numpy as np  # type: ignore
 
 try:
     from PyQt6.QtCore import Qt, pyqtSignal
@@ -33,7 +35,8 @@ class CalibrationPlotsWindow(QMainWindow):  # type: ignore[misc]
     accepted = pyqtSignal()
     retry = pyqtSignal()
 
-    def __init__(self, screen_resolution: Tuple[int, int], true_pts: List[Tuple[int, int]], pred_pts: List[Tuple[int, int]], threshold_px: float = 150.0):  # type: ignore[no-redef]
+    def __init__(self, screen_resolution: Tuple[int, int], true_pts: Sequence[Tuple[int, int]], pred_pts: Sequence[Tuple[int, int]], threshold_px: float = 150.0):  # type: ignore[no-redef]
+        """Point sets may be lists of (x, y) or (N, 2) arrays; arrays are used as-is."""
         super().__init__()
         self.setWindowTitle("Calibration Analysis")
         self.screen_resolution = screen_resolution
@@ -73,40 +76,27 @@ class CalibrationPlotsWindow(QMainWindow):  # type: ignore[misc]
         tabs = QTabWidget()
         # Scatter
         canv_scatter = FigureCanvas(fig_scatter(self.true_pts, self.pred_pts, self.errors))
+        # Kept for export; the PNG is the figure already on screen
+        self._canv_scatter = canv_scatter
         scatter_tab = QWidget()
         lt = QVBoxLayout()
         lt.addWidget(canv_scatter)
         scatter_tab.setLayout(lt)
         tabs.addTab(scatter_tab, "Scatter")
-        # Vectors
-        canv_vectors = FigureCanvas(fig_vectors(self.true_pts, self.pred_pts))
-        vec_tab = QWidget()
-        lv = QVBoxLayout()
-        lv.addWidget(canv_vectors)
-        vec_tab.setLayout(lv)
-        tabs.addTab(vec_tab, "Vectors")
-        # Heatmap
-        heat = compute_error_heatmap(self.errors, self.screen_resolution)
-        canv_heat = FigureCanvas(fig_heatmap(heat, self.screen_resolution))
-        heat_tab = QWidget()
-        lh = QVBoxLayout()
-        lh.addWidget(canv_heat)
-        heat_tab.setLayout(lh)
-        tabs.addTab(heat_tab, "Heatmap")
-        # Distribution
-        canv_hist = FigureCanvas(fig_histogram(self.errors))
-        hist_tab = QWidget()
-        lhist = QVBoxLayout()
-        lhist.addWidget(canv_hist)
-        hist_tab.setLayout(lhist)
-        tabs.addTab(hist_tab, "Distribution")
-        # Summary
-        canv_sum = FigureCanvas(fig_summary(self.mean_px, self.max_px, self.rms_px))
-        sum_tab = QWidget()
-        ls = QVBoxLayout()
-        ls.addWidget(canv_sum)
-        sum_tab.setLayout(ls)
-        tabs.addTab(sum_tab, "Summary")
+        # The remaining tabs get their figure on first activation, so opening
+        # the window only renders the scatter plot
+        self._builders = {
+            "Vectors": lambda: fig_vectors(self.true_pts, self.pred_pts),
+            "Heatmap": lambda: fig_heatmap(compute_error_heatmap(self.errors, self.screen_resolution), self.screen_resolution),
+            "Distribution": lambda: fig_histogram(self.errors),
+            "Summary": lambda: fig_summary(self.mean_px, self.max_px, self.rms_px),
+        }
+        for name in self._builders:
+            tab = QWidget()
+            tab.setLayout(QVBoxLayout())
+            tabs.addTab(tab, name)
+        tabs.currentChanged.connect(self._on_tab)  # type: ignore[attr-defined]
+        self._tabs = tabs
         v.addWidget(tabs, stretch=1)
 
         # Bottom bar
@@ -137,6 +127,11 @@ class CalibrationPlotsWindow(QMainWindow):  # type: ignore[misc]
             except Exception:
                 pass
 
+    def _on_tab(self, index: int) -> None:
+        builder = self._builders.pop(self._tabs.tabText(index), None)
+        if builder is not None:
+            self._tabs.widget(index).layout().addWidget(FigureCanvas(builder()))
+
     def _on_retry(self):
         self.retry.emit()
         self.close()
@@ -146,22 +141,15 @@ class CalibrationPlotsWindow(QMainWindow):  # type: ignore[misc]
         if not path:
             return
         # Export the scatter plot as canonical image
-        fig = fig_scatter(self.true_pts, self.pred_pts, self.errors)
-        fig.savefig(path, dpi=150)
-        try:
-            import matplotlib.pyplot as plt  # type: ignore
-            plt.close(fig)
-        except Exception:
-            pass
+        self._canv_scatter.figure.savefig(path, dpi=150)
 
     def _export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export CSV", filter="CSV Files (*.csv)")
         if not path:
             return
+        # One (N, 5) table written by numpy in a single pass
+        rows = np.array([(*e.true_xy, *e.pred_xy, e.dist_px) for e in self.errors], dtype=float).reshape(-1, 5)
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("true_x,true_y,pred_x,pred_y,dist_px\n")
-                for e in self.errors:
-                    f.write(f"{e.true_xy[0]},{e.true_xy[1]},{e.pred_xy[0]},{e.pred_xy[1]},{e.dist_px:.2f}\n")
+            np.savetxt(path, rows, fmt="%d,%d,%d,%d,%.2f", header="true_x,true_y,pred_x,pred_y,dist_px", comments="", encoding="utf-8")
         except Exception:
             pass
@@ -23,6 +23,8 @@ except Exception:  # pragma: no cover
     QRect = object  # type: ignore
     QGuiApplication = object  # type: ignore
 
+from MonocularTracker.ui.screen_geometry import primary_screen_size
+
 
 class CalibrationUI(QWidget):  # type: ignore[misc]
     sampleRequested = pyqtSignal(tuple)  # (x,y)
@@ -45,12 +47,32 @@ class CalibrationUI(QWidget):  # type: ignore[misc]
 
         # Runtime state
         self.targets: List[Tuple[int, int]] = []
+        # (sw, sh, margin_ratio, points) -> targets; entries are shared, never mutated
+        self._targets_cache: dict[tuple, List[Tuple[int, int]]] = {}
         self._active_index = -1
         self._samples_emitted = 0
         self._point_timer = None  # type: ignore[assignment]
         self._sample_timer = None  # type: ignore[assignment]
         self._live_xy: Tuple[int, int] | None = None
 
+        # Timers are created and connected once; _begin_point only restarts them
+        try:
+            self._sample_timer = QTimer(self)
+            self._sample_timer.timeout.connect(self._on_sample_tick)  # type: ignore[attr-defined]
+            self._point_timer = QTimer(self)
+            self._point_timer.setSingleShot(True)
+            self._point_timer.timeout.connect(self._on_point_done)  # type: ignore[attr-defined]
+        except Exception:
+            self._sample_timer = None
+            self._point_timer = None
+        # Coarse timers may fire ~5% late, which at a 60 ms sample interval
+        # loses samples at the end of each dwell
+        for t in (self._sample_timer, self._point_timer):
+            try:
+                t.setTimerType(Qt.TimerType.PreciseTimer)  # type: ignore[union-attr]
+            except Exception:
+                pass
+
         # Visuals
         try:
             self.setWindowFlags(
@@ -68,6 +90,22 @@ class CalibrationUI(QWidget):  # type: ignore[misc]
     # -----------------
     # Public API
     # -----------------
+    def reset(self, points_count: int | None = None, samples_per_point: int | None = None, dwell_ms: int | None = None) -> None:
+        """Stop any run in progress and reconfigure for the next start()."""
+        for t in (self._sample_timer, self._point_timer):
+            if t is not None:
+                t.stop()
+        if points_count is not None:
+            self._requested_points = int(points_count)
+        if samples_per_point is not None:
+            self.samples_per_point = int(max(1, samples_per_point))
+        if dwell_ms is not None:
+            self.dwell_ms = int(max(1, dwell_ms))
+        self.targets = []
+        self._active_index = -1
+        self._samples_emitted = 0
+        self._live_xy = None
+
     def start(self) -> None:
         if not isinstance(self, QWidget):
             return
@@ -84,18 +122,21 @@ class CalibrationUI(QWidget):  # type: ignore[misc]
     # Internals
     # -----------------
     def _compute_targets(self) -> None:
-        self.targets.clear()
         try:
-            screen = QGuiApplication.primaryScreen()
-            geom = screen.geometry()  # type: ignore[attr-defined]
-            sw, sh = geom.width(), geom.height()
+            sw, sh = primary_screen_size()
             mx = int(sw * self.margin_ratio)
             my = int(sh * self.margin_ratio)
         except Exception:
             # Fallback values
             sw, sh = 1920, 1080
             mx, my = int(sw * self.margin_ratio), int(sh * self.margin_ratio)
+        self._screen_size = (sw, sh)
 
+        key = (sw, sh, self.margin_ratio, self._requested_points)
+        cached = self._targets_cache.get(key)
+        if cached is not None:
+            self.targets = cached
+            return
         center = (sw // 2, sh // 2)
         tl = (mx, my)
         tr = (sw - mx, my)
@@ -109,8 +150,8 @@ class CalibrationUI(QWidget):  # type: ignore[misc]
             left = (mx, (tl[1] + bl[1]) // 2)
             right = (sw - mx, (tr[1] + br[1]) // 2)
             pts.extend([top, bottom, left, right])
-        self.targets.extend(pts)
-        self._screen_size = (sw, sh)
+        self._targets_cache[key] = pts
+        self.targets = pts
 
     def _begin_point(self) -> None:
         # Start timers for samples and for point duration
@@ -119,17 +160,13 @@ class CalibrationUI(QWidget):  # type: ignore[misc]
             return
         self._samples_emitted = 0
         interval = max(1, int(self.dwell_ms / max(1, self.samples_per_point)))
-        # Sample timer
-        self._sample_timer = QTimer()
-        self._sample_timer.setInterval(interval)
-        self._sample_timer.timeout.connect(self._on_sample_tick)  # type: ignore[attr-defined]
-        self._sample_timer.start()
-        # Point duration timer
-        self._point_timer = QTimer()
-        self._point_timer.setSingleShot(True)
-        self._point_timer.setInterval(self.dwell_ms)
-        self._point_timer.timeout.connect(self._on_point_done)  # type: ignore[attr-defined]
-        self._point_timer.start()
+        if self._sample_timer is not None and self._point_timer is not None:
+            # Sample timer
+            self._sample_timer.setInterval(interval)
+            self._sample_timer.start()
+            # Point duration timer
+            self._point_timer.setInterval(self.dwell_ms)
+            self._point_timer.start()
         self.update()
 
     def _on_sample_tick(self) -> None:
@@ -153,6 +190,9 @@ class CalibrationUI(QWidget):  # type: ignore[misc]
         self._begin_point()
 
     def _finish_all(self) -> None:
+        for t in (self._sample_timer, self._point_timer):
+            if t is not None:
+                t.stop()
         self.calibrationFinished.emit()  # type: ignore[attr-defined]
         try:
             self.close()
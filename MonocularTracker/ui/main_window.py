@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Optional
 
 try:
-    from PyQt6.QtCore import Qt, pyqtSignal
+    from PyQt6.QtCore import QEvent, Qt, pyqtSignal
     from PyQt6.QtWidgets import (
         QWidget,
         QMainWindow,
@@ -41,6 +41,7 @@ class MainWindow(QMainWindow):  # type: ignore[misc]
     useSelectedCameraRequested = pyqtSignal()
     eyeModeChanged = pyqtSignal(str)
     signalConfigChanged = pyqtSignal(float, float, float, float, int)
+    visibilityChanged = pyqtSignal(bool)  # False when hidden or minimized
 
     def __init__(self):  # type: ignore[no-redef]
         super().__init__()
@@ -297,11 +298,35 @@ class MainWindow(QMainWindow):  # type: ignore[misc]
         w.setLayout(v)
         return w
 
+    # Visibility --------------------------------------------------------
+    def _emit_visibility(self) -> None:
+        visible = bool(self.isVisible() and not self.isMinimized())
+        if visible != getattr(self, "_last_visible", None):
+            self._last_visible = visible
+            self.visibilityChanged.emit(visible)
+
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        self._emit_visibility()
+
+    def hideEvent(self, event):  # type: ignore[override]
+        super().hideEvent(event)
+        self._emit_visibility()
+
+    def changeEvent(self, event):  # type: ignore[override]
+        super().changeEvent(event)
+        try:
+            if event.type() == QEvent.Type.WindowStateChange:
+                self._emit_visibility()
+        except Exception:
+            pass
+
     # Public update API -------------------------------------------------
     def update_status(self, *, face_ok: bool, eye_ok: bool, conf: float, fps: float) -> None:
         self.status_label.setText(f"Face: {'detected' if face_ok else 'lost'} | Eye: {'detected' if eye_ok else 'lost'} | Conf: {int(conf*100)}% | FPS: {fps:.1f}")
 
     def update_video(self, *, frame, landmarks=None, iris=None, box=None, predicted=None) -> None:
+        """frame: C-contiguous BGR uint8 (H, W, 3), displayed without a copy."""
         self.video.set_overlays(frame=frame, landmarks=landmarks, iris_center=iris, eyelid_box=box, predicted=predicted, show_landmarks=True, show_vector=True, show_pred=True)
 
     def toggle_controls(self, tracking: bool) -> None:
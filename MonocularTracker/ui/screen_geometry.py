@@ -0,0 +1,87 @@
+"""
+Primary screen size, cached until Qt reports a screen change.
+
+CalibrationUI reads the size from here; other components register with
+on_screen_change() so their own copies refresh on exactly the same triggers:
+a screen added or removed, the primary screen changing, or a screen's
+geometry changing.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Set, Tuple
+
+try:
+    from PyQt6.QtGui import QGuiApplication
+except Exception:  # pragma: no cover
+    QGuiApplication = None  # type: ignore
+
+
+# (width, height) keyed by id(QScreen)
+_cache: Dict[int, Tuple[int, int]] = {}
+# Live screens whose geometryChanged is connected
+_hooked: Set[int] = set()
+_listeners: List[Callable[[], None]] = []
+_app_hooked = False
+
+
+def _changed(*_args) -> None:
+    _cache.clear()
+    for cb in list(_listeners):
+        try:
+            cb()
+        except Exception:
+            pass
+
+
+def _hook_screen(screen) -> None:
+    key = id(screen)
+    if screen is None or key in _hooked:
+        return
+    _hooked.add(key)
+    screen.geometryChanged.connect(_changed)
+
+
+def _screen_removed(screen) -> None:
+    # Its id may be reused by a later QScreen, which must get its own hook
+    _hooked.discard(id(screen))
+    _changed()
+
+
+def _primary_changed(screen) -> None:
+    _hook_screen(screen)
+    _changed()
+
+
+def _ensure_hooks() -> None:
+    global _app_hooked
+    if _app_hooked:
+        return
+    app = QGuiApplication.instance() if QGuiApplication is not None else None
+    if app is None:
+        return
+    _app_hooked = True
+    app.screenAdded.connect(_changed)
+    app.screenRemoved.connect(_screen_removed)
+    app.primaryScreenChanged.connect(_primary_changed)
+
+
+def primary_screen_size() -> Tuple[int, int]:
+    """(width, height) of the primary screen in Qt logical pixels."""
+    _ensure_hooks()
+    screen = QGuiApplication.primaryScreen()
+    key = id(screen)
+    size = _cache.get(key)
+    if size is not None:
+        return size
+    geom = screen.geometry()
+    size = (geom.width(), geom.height())
+    _hook_screen(screen)
+    _cache[key] = size
+    return size
+
+
+def on_screen_change(callback: Callable[[], None]) -> None:
+    """Call ``callback()`` (on the GUI thread) whenever the cached size is invalidated."""
+    _ensure_hooks()
+    _hook_screen(QGuiApplication.primaryScreen())
+    _listeners.append(callback)
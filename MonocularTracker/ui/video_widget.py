@@ -7,7 +7,6 @@ try:
     from PyQt6.QtGui import QImage, QPainter, QColor, QPen
     from PyQt6.QtWidgets import QWidget
     import numpy as np  # type: ignore
-    import cv2  # type: ignore
 except Exception:  # pragma: no cover
     QWidget = object  # type: ignore
     QImage = object  # type: ignore
@@ -15,7 +14,6 @@ except Exception:  # pragma: no cover
     QColor = object  # type: ignore
     QPen = object  # type: ignore
     np = None  # type: ignore
-    cv2 = None  # type: ignore
 
 
 class VideoWidget(QWidget):  # type: ignore[misc]
@@ -90,8 +88,16 @@ class VideoWidget(QWidget):  # type: ignore[misc]
 
     @staticmethod
     def _to_qimage(frame):
-        if cv2 is None:
+        """Wrap a BGR uint8 frame as a QImage without copying or converting.
+
+        The QImage borrows the array's memory, so it must not outlive the
+        frame; paintEvent keeps it referenced via self._frame.
+        """
+        if np is None:
             return None
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        return QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
+        h, w = frame.shape[:2]
+        if not frame.flags["C_CONTIGUOUS"]:
+            # The temporary dies on return, so let the QImage own a copy
+            tmp = np.ascontiguousarray(frame)
+            return QImage(tmp.data, w, h, int(tmp.strides[0]), QImage.Format.Format_BGR888).copy()
+        return QImage(frame.data, w, h, int(frame.strides[0]), QImage.Format.Format_BGR888)
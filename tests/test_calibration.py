@@ -0,0 +1,24 @@
+import numpy as np
+
+from MonocularTracker.tracking import calibration
+from MonocularTracker.tracking.calibration import Calibrator
+
+
+def test_poly2_default_fits_quadratic_map_and_round_trips(tmp_path, monkeypatch):
+    log = tmp_path / "calibration.log"
+    monkeypatch.setattr(calibration, "_LOG_PATH", str(log))
+    rng = np.random.default_rng(0)
+    c = Calibrator()
+    assert c.method == "poly2"
+    for fx, fy in rng.random((30, 2)):
+        c.add((fx, fy), (int(round(400 + 900 * fx * fx)), int(round(100 + 600 * fy))))
+    c.configure_robust(False)
+    c.train()
+    mean_err, max_err = c.accuracy()
+    assert max_err < 50.0
+    assert log.read_text().startswith("Calibration: samples=30")
+    path = tmp_path / "calib.json"
+    c.save(str(path))
+    c2 = Calibrator.load(str(path))
+    f = (0.3, 0.7)
+    assert c2.predict(f) == c.predict(f)
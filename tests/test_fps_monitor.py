@@ -0,0 +1,17 @@
+from MonocularTracker.control import fps_monitor
+from MonocularTracker.control.fps_monitor import FPSMonitor
+
+
+def test_fps_empty():
+    assert FPSMonitor(window=5).fps() == 0.0
+
+
+def test_fps_ring_buffer(monkeypatch):
+    t = [0.0]
+    monkeypatch.setattr(fps_monitor.time, "perf_counter", lambda: t[0])
+    mon = FPSMonitor(window=4)
+    # Slow ticks first, then fast ones that should fully replace them
+    for dt in (0.5, 0.5, 0.5) + (0.02,) * 8:
+        t[0] += dt
+        mon.tick()
+    assert abs(mon.fps() - 50.0) < 1e-6
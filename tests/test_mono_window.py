@@ -0,0 +1,24 @@
+import random
+
+from MonocularTracker.control.mono_window import MonoWindow
+
+
+def test_mono_window_matches_scan():
+    rng = random.Random(0)
+    w = MonoWindow(size=7)
+    vals = []
+    for _ in range(200):
+        v = rng.random()
+        vals.append(v)
+        w.push(v)
+        recent = vals[-7:]
+        assert w.range() == max(recent) - min(recent)
+
+
+def test_mono_window_resize_keeps_newest():
+    w = MonoWindow(size=5)
+    for v in (9.0, 1.0, 2.0, 3.0, 4.0):
+        w.push(v)
+    w.resize(3)
+    assert len(w) == 3
+    assert (w.min(), w.max()) == (2.0, 4.0)
@@ -0,0 +1,26 @@
+import random
+
+from MonocularTracker.control.running_window import RunningWindow
+
+
+def test_running_window_matches_scan():
+    rng = random.Random(0)
+    w = RunningWindow(size=7)
+    vals = []
+    for _ in range(200):
+        v = rng.uniform(-1e6, 1e6)
+        vals.append(v)
+        w.push(v)
+        recent = vals[-7:]
+        assert len(w) == len(recent)
+        assert abs(w.mean() - sum(recent) / len(recent)) < 1e-6
+
+
+def test_running_window_reset():
+    w = RunningWindow(size=3)
+    for v in (1.0, 2.0, 3.0, 4.0):
+        w.push(v)
+    w.reset()
+    assert (len(w), w.mean()) == (0, 0.0)
+    w.push(5.0)
+    assert w.sum() == 5.0
@@ -0,0 +1,33 @@
+from MonocularTracker.core.settings import SettingsManager
+
+
+def test_camera_cache_follows_profile_and_index():
+    s = SettingsManager()
+    s.data["camera_profiles"] = {"0": {"fps": 15}}
+    s.data.setdefault("camera", {})["fps"] = 30
+    s.set_camera_index(0)
+    assert s.camera_fps() == 15
+    # Index without its own value falls back to the "camera" section
+    s.set_camera_index(1)
+    assert s.camera_fps() == 30
+    s.set_camera_fps(60)
+    assert s.camera_fps() == 60
+    assert s.data["camera_profiles"]["1"]["fps"] == 60
+
+
+def test_load_reuses_parsed_file_without_sharing_data():
+    a = SettingsManager()
+    b = SettingsManager()
+    assert a.data == b.data
+    a.data["camera_index"] = 99
+    assert b.data.get("camera_index") != 99
+
+
+def test_calib_method_from_regressor_section():
+    s = SettingsManager()
+    s.data["regressor"] = {"type": "poly", "degree": 3}
+    assert s.calib_method() == "poly3"
+    s.data["regressor"] = {"type": "mlp"}
+    assert s.calib_method() == "mlp"
+    s.data.pop("regressor")
+    assert s.calib_method() == "poly2"